@@ -0,0 +1,237 @@
+"""Engine benchmarks with scaling curves and baseline regression gates.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_engine --output bench.json
+    python -m benchmarks.bench_engine --baseline benchmarks/baseline.json --threshold 1.5
+
+The exit status is 1 when any case is slower than the baseline by more than
+the threshold ratio.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from game.game_state import GameState
+from game.player import Player
+from game.unit import Unit, UnitType
+from scripts.script_parser import ScriptParser
+
+MAP_SIZES = [8, 32, 128, 512, 1024]
+UNIT_COUNTS = [10, 100, 1000, 10000]
+QUICK_MAP_SIZES = [8, 32]
+QUICK_UNIT_COUNTS = [10, 100]
+
+def make_state(map_size: int, unit_count: int, seed: int = 0) -> GameState:
+    """Build a two-player game with units of random types on distinct cells"""
+    # Grow the map if it cannot hold every unit on its own cell
+    side = max(map_size, math.ceil(math.sqrt(unit_count * 2)))
+    state = GameState(side, side)
+    rng = random.Random(seed)
+    players = [Player("player1", "Player 1"), Player("player2", "Player 2")]
+    for player in players:
+        state.add_player(player)
+
+    cells = rng.sample(range(side * side), unit_count)
+    unit_types = list(UnitType)
+    for index, cell in enumerate(cells):
+        player = players[index % 2]
+        unit = Unit(f"u{index}", rng.choice(unit_types), player.player_id, (cell % side, cell // side))
+        if index % 3 == 0:
+            unit.add_buff({"attribute": "attack", "value": 0.2})
+            unit.add_debuff({"attribute": "defense", "value": 0.1})
+        player.add_unit(unit)
+    return state
+
+def make_script(lines: int) -> str:
+    """Build a script with the given number of action lines"""
+    actions = ["move north 2", "attack nearest infantry", "defend", "heal self 10", "# comment"]
+    return "\n".join(actions[i % len(actions)] for i in range(lines))
+
+def play_turn(state: GameState) -> None:
+    """One headless turn: every unit of the current player steps towards the
+    centre if the cell is free and sizes up its attack"""
+    centre = (state.map.width // 2, state.map.height // 2)
+    for unit in state.players[state.current_player_id].units:
+        x, y = unit.position
+        step = (x + (centre[0] > x) - (centre[0] < x), y)
+        if state.get_unit_at_position(step) is None:
+            state.update_unit_position(unit, step)
+        unit.get_total_attack()
+    state.next_turn()
+
+def time_call(func: Callable[[], object], repeat: int, min_time: float = 0.05) -> Dict[str, float]:
+    """Time a callable, looping fast calls so each sample lasts long enough"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    loops = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {'seconds': statistics.median(samples), 'min': min(samples), 'loops': loops}
+
+def _bench_valid_moves(map_size: int) -> Callable:
+    state = make_state(map_size, 2)
+    unit = state.players["player1"].units[0]
+    return lambda: state.map.get_valid_moves(unit)
+
+def _bench_unit_lookup(unit_count: int) -> Callable:
+    state = make_state(8, unit_count)
+    # Probe an empty cell so the whole roster is scanned
+    probe = (-1, -1)
+    return lambda: state.get_unit_at_position(probe)
+
+def _bench_attack_defense(unit_count: int) -> Callable:
+    state = make_state(8, unit_count)
+    units = [unit for player in state.players.values() for unit in player.units]
+    def run():
+        for unit in units:
+            unit.get_total_attack()
+            unit.get_total_defense()
+    return run
+
+def _bench_parse_script(unit_count: int) -> Callable:
+    parser = ScriptParser()
+    script = make_script(unit_count)
+    return lambda: parser.parse_script(script)
+
+def _bench_next_turn(unit_count: int) -> Callable:
+    state = make_state(8, unit_count)
+    return state.next_turn
+
+def _bench_headless_turn(unit_count: int) -> Callable:
+    state = make_state(8, unit_count)
+    return lambda: play_turn(state)
+
+def _bench_render(map_size: int) -> Callable:
+    from ui.offscreen import OffscreenRenderer
+    state = make_state(map_size, 100)
+    renderer = OffscreenRenderer(state.map, cell_size=4)
+    def run():
+        # Redraw the terrain layer too, so the curve follows the map size
+        renderer.map_renderer.invalidate_terrain()
+        renderer.render_frame(state)
+    return run
+
+# name -> (parameter name, factory building the timed callable for a parameter value)
+BENCHMARKS = {
+    'get_valid_moves': ('map_size', _bench_valid_moves),
+    'get_unit_at_position': ('unit_count', _bench_unit_lookup),
+    'get_total_attack_defense': ('unit_count', _bench_attack_defense),
+    'parse_script': ('unit_count', _bench_parse_script),
+    'next_turn': ('unit_count', _bench_next_turn),
+    'headless_turn': ('unit_count', _bench_headless_turn),
+    'render': ('map_size', _bench_render),
+}
+
+def scaling_exponent(points: Sequence[tuple]) -> Optional[float]:
+    """Least-squares slope of log(time) against log(size); about 1 for linear
+    and 2 for quadratic operations"""
+    points = [(math.log(size), math.log(seconds)) for size, seconds in points if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+def run_benchmarks(map_sizes: Sequence[int] = MAP_SIZES, unit_counts: Sequence[int] = UNIT_COUNTS,
+                   names: Optional[Sequence[str]] = None, repeat: int = 5,
+                   min_time: float = 0.05) -> Dict:
+    """Run the selected benchmarks and return the machine-readable report"""
+    results = []
+    scaling = {}
+    for name, (param, factory) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        values = map_sizes if param == 'map_size' else unit_counts
+        points = []
+        for value in values:
+            timing = time_call(factory(value), repeat, min_time)
+            results.append({'key': f"{name}[{param}={value}]", 'name': name, 'params': {param: value}, **timing})
+            points.append((value, timing['min']))
+        scaling[name] = scaling_exponent(points)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.time()
+        },
+        'results': results,
+        'scaling': scaling
+    }
+
+def compare(report: Dict, baseline: Dict, threshold: float = 1.5, noise_floor: float = 1e-6) -> List[Dict]:
+    """Get the cases slower than the baseline by more than the threshold ratio.
+
+    Cases faster than noise_floor seconds in the baseline are skipped.
+    """
+    baseline_times = {result['key']: result['min'] for result in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        before = baseline_times.get(result['key'])
+        if before is None or before < noise_floor:
+            continue
+        ratio = result['min'] / before
+        if ratio > threshold:
+            regressions.append({'key': result['key'], 'baseline': before, 'current': result['min'], 'ratio': ratio})
+    return regressions
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the game engine")
+    parser.add_argument('--output', help="write the report as JSON to this file")
+    parser.add_argument('--baseline', help="compare against this report")
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help="fail when a case is this many times slower than the baseline")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="overwrite the baseline with this run instead of comparing")
+    parser.add_argument('--quick', action='store_true', help="only run the smallest sizes")
+    parser.add_argument('--only', nargs='*', choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        QUICK_MAP_SIZES if args.quick else MAP_SIZES,
+        QUICK_UNIT_COUNTS if args.quick else UNIT_COUNTS,
+        args.only,
+        args.repeat
+    )
+    for result in report['results']:
+        print(f"{result['key']:<45} {result['min'] * 1000:12.4f} ms")
+    for name, exponent in report['scaling'].items():
+        if exponent is not None:
+            print(f"{name:<45} scales as n^{exponent:.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        if args.update_baseline or not os.path.exists(args.baseline):
+            with open(args.baseline, 'w') as f:
+                json.dump(report, f, indent=2)
+            return 0
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['key']}: {regression['baseline'] * 1000:.4f} ms -> "
+                  f"{regression['current'] * 1000:.4f} ms ({regression['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,37 @@
-# from .game_state import GameState
-# from .player import Player
-# from .unit import Unit, UnitType
-# from .map import GameMap, TerrainType
-# from .action import Action
-# from .resource import Resource
+import importlib
 
-# __all__ = [
-#     'GameState',
-#     'Player',
-#     'Unit',
-#     'UnitType',
-#     'GameMap',
-#     'TerrainType',
-#     'Action',
-#     'Resource'
-# ] 
\ No newline at end of file
+# Exported names and the submodule defining them. Submodules are imported on
+# first access so importing the package stays cheap.
+_EXPORTS = {
+    'GameState': '.game_state',
+    'Player': '.player',
+    'Unit': '.unit',
+    'UnitType': '.unit',
+    'UnitStatus': '.unit',
+    'UnitStats': '.unit',
+    'UnitStatistics': '.unit',
+    'TerrainType': '.unit',
+    'GameMap': '.map',
+    'TerrainEffects': '.map',
+    'MapDefinitions': '.map_definitions',
+    'Action': '.action',
+    'InfluenceMap': '.influence',
+    'BatchEnvironment': '.batch_env',
+    'TurnScheduler': '.scheduler',
+    'SchedulingMode': '.scheduler',
+    'Order': '.scheduler',
+    'ResourceLedger': '.economy',
+    'CostTable': '.economy'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+@dataclass
+class Action:
+    """A single parsed script action"""
+    action_type: str
+    target: Dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,247 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .map import TerrainEffects
+from .map_definitions import MapDefinitions
+from .unit import TerrainType, UnitStatistics, UnitType
+
+TERRAIN_TYPES = list(TerrainType)
+UNIT_TYPES = list(UnitType)
+
+DEFAULT_ARMY = [UnitType.INFANTRY, UnitType.ARCHER, UnitType.CAVALRY]
+
+def terrain_codes(map_name: str) -> np.ndarray:
+    """Get a map's terrain as an int8 grid of TERRAIN_TYPES indices, indexed [y, x]"""
+    width, height = MapDefinitions.get_map_size(map_name)
+    terrain = MapDefinitions.get_terrain_map(map_name)
+    codes = {terrain_type: index for index, terrain_type in enumerate(TERRAIN_TYPES)}
+    return np.array([[codes[t] for t in row[:width]] for row in terrain[:height]], dtype=np.int8)
+
+def movement_cost_table() -> np.ndarray:
+    """TerrainEffects.MOVEMENT_COSTS as a [terrain, unit type] array"""
+    return np.array([
+        [TerrainEffects.MOVEMENT_COSTS[terrain][unit_type] for unit_type in UNIT_TYPES]
+        for terrain in TERRAIN_TYPES
+    ])
+
+def combat_modifier_table() -> np.ndarray:
+    """TerrainEffects.COMBAT_MODIFIERS as a [terrain, unit type] array, 1.0 where unset"""
+    return np.array([
+        [TerrainEffects.COMBAT_MODIFIERS.get(terrain, {}).get(unit_type, 1.0) for unit_type in UNIT_TYPES]
+        for terrain in TERRAIN_TYPES
+    ])
+
+class BatchEnvironment:
+    """N independent two-player matches stepped together with array operations.
+
+    Every match fields the same armies. Unit stats are shared columns of shape
+    (U,); positions and health are (N, U) arrays. Each step the current player
+    of every match moves its units by the requested offsets, walking along x
+    then y and stopping before impassable terrain or a cell whose movement
+    cost exceeds what is left of the unit's movement. Moves into occupied or
+    contested cells are bounced as in TurnScheduler.resolve. Then each of its
+    units attacks the nearest enemy in range using the same damage rule as
+    Unit.take_damage. Matches that end are reset automatically.
+    """
+
+    def __init__(self, num_envs: int, map_name: Union[str, Sequence[str]] = "small_duel",
+                 armies: Optional[Dict[str, List[UnitType]]] = None,
+                 max_turns: int = 100):
+        map_names = [map_name] * num_envs if isinstance(map_name, str) else list(map_name)
+        if len(map_names) != num_envs:
+            raise ValueError("Need one map name per environment")
+        sizes = {MapDefinitions.get_map_size(name) for name in map_names}
+        if len(sizes) != 1:
+            raise ValueError("All maps in a batch must have the same size")
+
+        self.num_envs = num_envs
+        self.width, self.height = sizes.pop()
+        self.max_turns = max_turns
+        self.player_ids: Tuple[str, ...] = ("player1", "player2")
+
+        # Terrain, stacked per match
+        map_terrain = {name: terrain_codes(name) for name in set(map_names)}
+        self.terrain = np.stack([map_terrain[name] for name in map_names])
+        self.terrain_one_hot = (
+            self.terrain[:, None, :, :] == np.arange(len(TERRAIN_TYPES))[None, :, None, None]
+        ).astype(np.float32)
+        self.movement_costs = movement_cost_table()
+        self.combat_modifiers = combat_modifier_table()
+
+        # Unit columns shared by all matches
+        armies = armies or {player_id: DEFAULT_ARMY for player_id in self.player_ids}
+        unit_types, owners = [], []
+        for owner, player_id in enumerate(self.player_ids):
+            unit_types.extend(armies[player_id])
+            owners.extend([owner] * len(armies[player_id]))
+        stats = [UnitStatistics.BASE_STATS[unit_type] for unit_type in unit_types]
+        self.num_units = len(unit_types)
+        self.unit_type = np.array([UNIT_TYPES.index(t) for t in unit_types], dtype=np.int8)
+        self.owner = np.array(owners, dtype=np.int8)
+        self.max_health = np.array([s.health for s in stats], dtype=np.int32)
+        self.attack = np.array([s.attack for s in stats], dtype=np.int32)
+        self.defense = np.array([s.defense for s in stats], dtype=np.int32)
+        self.movement = np.array([s.movement for s in stats], dtype=np.int32)
+        self.min_range = np.array([s.range[0] for s in stats], dtype=np.int32)
+        self.max_range = np.array([s.range[1] for s in stats], dtype=np.int32)
+
+        # Spawn positions per match, cycling through each player's spawn points
+        self.start_x = np.zeros((num_envs, self.num_units), dtype=np.int32)
+        self.start_y = np.zeros((num_envs, self.num_units), dtype=np.int32)
+        for env, name in enumerate(map_names):
+            spawn_points = MapDefinitions.get_spawn_points(name)
+            counts = [0] * len(self.player_ids)
+            for unit, owner in enumerate(owners):
+                points = spawn_points[self.player_ids[owner]]
+                self.start_x[env, unit], self.start_y[env, unit] = points[counts[owner] % len(points)]
+                counts[owner] += 1
+
+        # Per-match state
+        self.x = self.start_x.copy()
+        self.y = self.start_y.copy()
+        self.health = np.tile(self.max_health, (num_envs, 1))
+        self.turn_number = np.zeros(num_envs, dtype=np.int32)
+        self.current_player = np.zeros(num_envs, dtype=np.int8)
+        self.reset()
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.health > 0
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Reset the selected matches (all by default) and return observations"""
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        self.x[mask] = self.start_x[mask]
+        self.y[mask] = self.start_y[mask]
+        self.health[mask] = self.max_health
+        self.turn_number[mask] = 0
+        self.current_player[mask] = 0
+        return self.observe()
+
+    def observe(self) -> np.ndarray:
+        """Get a (N, channels, height, width) float32 observation per match.
+
+        Channels are the terrain one-hot planes followed by the summed health
+        fraction of the current player's units and of the enemy's units.
+        """
+        units = np.zeros((self.num_envs, 2, self.height, self.width), dtype=np.float32)
+        env, unit = np.nonzero(self.alive)
+        side = (self.owner[unit] != self.current_player[env]).astype(np.intp)
+        np.add.at(
+            units,
+            (env, side, self.y[env, unit], self.x[env, unit]),
+            self.health[env, unit] / self.max_health[unit]
+        )
+        return np.concatenate([self.terrain_one_hot, units], axis=1)
+
+    def step(self, actions: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """Advance every match by one player turn.
+
+        actions holds an (N, U, 2) array of (dx, dy) offsets; offsets for units
+        not owned by the current player are ignored. Returns observations,
+        damage dealt by the acting player, done flags and an info dict with the
+        winner index of finished matches (-1 for a draw).
+        """
+        acting = self.alive & (self.owner[None, :] == self.current_player[:, None])
+
+        if actions is not None:
+            self._move(np.asarray(actions), acting)
+        damage = self._attack(acting)
+        rewards = damage.sum(axis=1).astype(np.float32)
+
+        # Advance turns
+        self.current_player = (1 - self.current_player).astype(np.int8)
+        self.turn_number += self.current_player == 0
+
+        # Check for finished matches
+        alive = self.alive
+        side_alive = np.stack([(alive & (self.owner == side)).any(axis=1) for side in range(2)], axis=1)
+        dones = ~side_alive.all(axis=1) | (self.turn_number >= self.max_turns)
+        winner = np.where(side_alive[:, 0] & ~side_alive[:, 1], 0, np.where(side_alive[:, 1] & ~side_alive[:, 0], 1, -1))
+        info = {'winner': np.where(dones, winner, -1), 'turn_number': self.turn_number.copy()}
+
+        if dones.any():
+            self.reset(dones)
+        return self.observe(), rewards, dones, info
+
+    def _move(self, actions: np.ndarray, acting: np.ndarray) -> None:
+        dx = actions[..., 0].astype(np.int32)
+        dy = actions[..., 1].astype(np.int32)
+        env = np.arange(self.num_envs)[:, None]
+
+        # Walk every unit one cell at a time, x first then y, paying the
+        # movement cost of each cell entered
+        target_x, target_y = self.x.copy(), self.y.copy()
+        budget = np.where(acting, self.movement[None, :], 0).astype(np.float64)
+        walking = acting.copy()
+        for _ in range(int(self.movement.max())):
+            step_x = np.sign(dx)
+            step_y = np.where(dx == 0, np.sign(dy), 0)
+            next_x = target_x + step_x
+            next_y = target_y + step_y
+            inside = (next_x >= 0) & (next_x < self.width) & (next_y >= 0) & (next_y < self.height)
+            terrain = self.terrain[env, np.clip(next_y, 0, self.height - 1), np.clip(next_x, 0, self.width - 1)]
+            cost = self.movement_costs[terrain, self.unit_type[None, :]]
+            walking &= inside & ((step_x != 0) | (step_y != 0)) & (cost <= budget)
+            if not walking.any():
+                break
+            target_x = np.where(walking, next_x, target_x)
+            target_y = np.where(walking, next_y, target_y)
+            budget = np.where(walking, budget - cost, budget)
+            dx = np.where(walking, dx - step_x, dx)
+            dy = np.where(walking, dy - step_y, dy)
+
+        # Settle collisions like TurnScheduler.resolve: a contested cell goes to
+        # the unit with the most movement (then the lowest index), and moves into
+        # a cell that stays occupied are bounced until nothing changes
+        moving = acting & ((target_x != self.x) | (target_y != self.y))
+        cells = self.height * self.width
+        current = self.y * self.width + self.x
+        target = target_y * self.width + target_x
+        envs = np.broadcast_to(env, target.shape)
+        priority = np.broadcast_to(
+            self.movement * self.num_units + np.arange(self.num_units)[::-1], target.shape
+        )
+        while moving.any():
+            staying = self.alive & ~moving
+            occupied = np.zeros((self.num_envs, cells), dtype=bool)
+            occupied[envs[staying], current[staying]] = True
+            best = np.full((self.num_envs, cells), -1)
+            np.maximum.at(best, (envs[moving], target[moving]), priority[moving])
+            bounced = moving & (occupied[envs, target] | (best[envs, target] != priority))
+            if not bounced.any():
+                break
+            moving &= ~bounced
+
+        self.x = np.where(moving, target_x, self.x)
+        self.y = np.where(moving, target_y, self.y)
+
+    def _attack(self, acting: np.ndarray) -> np.ndarray:
+        # Pairwise Manhattan distances, (N, attacker, target)
+        distance = (
+            np.abs(self.x[:, :, None] - self.x[:, None, :])
+            + np.abs(self.y[:, :, None] - self.y[:, None, :])
+        )
+        valid = (
+            acting[:, :, None]
+            & self.alive[:, None, :]
+            & (self.owner[:, None] != self.owner[None, :])[None, :, :]
+            & (distance >= self.min_range[None, :, None])
+            & (distance <= self.max_range[None, :, None])
+        )
+        has_target = valid.any(axis=2)
+        target = np.where(valid, distance, np.iinfo(np.int32).max).argmin(axis=2)
+
+        # Attack strength depends on the terrain under the attacker
+        env = np.arange(self.num_envs)[:, None]
+        modifier = self.combat_modifiers[self.terrain[env, self.y, self.x], self.unit_type[None, :]]
+        attack = (self.attack[None, :] * modifier).astype(np.int32)
+        damage = np.maximum(0, attack - self.defense[target])
+        damage = np.where(has_target, damage, 0)
+
+        # Several attackers can hit the same target, so accumulate per target
+        taken = np.zeros_like(self.health)
+        np.add.at(taken, (np.broadcast_to(env, target.shape), target), damage)
+        dealt = np.minimum(taken, self.health)
+        self.health = self.health - dealt
+        return dealt
@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Sequence, Union
+import numpy as np
+from .unit import UnitStatistics, UnitType
+
+if TYPE_CHECKING:
+    from utils.config import GameConfig
+
+RESOURCES = ("gold", "wood", "iron", "food")
+UNIT_TYPES = list(UnitType)
+
+# Either unit counts keyed by type, or a sequence of units in build order
+BuildOrder = Union[Mapping[Union[UnitType, str], int], Sequence[Union[UnitType, str]]]
+
+def resource_vector(amounts: Mapping[str, int]) -> np.ndarray:
+    """Convert a resource dict to an array indexed like RESOURCES"""
+    unknown = set(amounts) - set(RESOURCES)
+    if unknown:
+        raise ValueError(f"Unknown resources: {sorted(unknown)}")
+    return np.array([amounts.get(resource, 0) for resource in RESOURCES], dtype=np.int64)
+
+def _unit_index(unit_type: Union[UnitType, str]) -> int:
+    return UNIT_TYPES.index(UnitType(unit_type))
+
+def _check_sequence(build_order: Sequence[Union[UnitType, str]]) -> None:
+    # A bare string is a sequence of characters, not of unit types
+    if isinstance(build_order, str):
+        raise ValueError(f"Build order must be a list of unit types, not the string {build_order!r}")
+
+class CostTable:
+    """Unit costs compiled into a [unit type, resource] matrix.
+
+    Costs come from UnitStatistics.BASE_STATS; overrides keyed by unit type
+    name replace the cost of that unit type.
+    """
+
+    def __init__(self, overrides: Optional[Mapping[str, Mapping[str, int]]] = None):
+        costs = {unit_type.value: UnitStatistics.BASE_STATS[unit_type].cost for unit_type in UNIT_TYPES}
+        for name, cost in (overrides or {}).items():
+            UnitType(name)  # raises ValueError for unknown unit types
+            costs[name] = cost
+        self.matrix = np.stack([resource_vector(costs[unit_type.value]) for unit_type in UNIT_TYPES])
+
+    def get_cost(self, unit_type: Union[UnitType, str]) -> Dict[str, int]:
+        """Get the cost of one unit as a resource dict"""
+        return {resource: int(amount) for resource, amount in zip(RESOURCES, self.matrix[_unit_index(unit_type)])}
+
+    def order_counts(self, build_order: BuildOrder) -> np.ndarray:
+        """Get the number of units of each type in a build order"""
+        counts = np.zeros(len(UNIT_TYPES), dtype=np.int64)
+        if isinstance(build_order, Mapping):
+            for unit_type, count in build_order.items():
+                if count < 0:
+                    raise ValueError("Unit counts cannot be negative")
+                counts[_unit_index(unit_type)] += count
+        else:
+            _check_sequence(build_order)
+            np.add.at(counts, [_unit_index(unit_type) for unit_type in build_order], 1)
+        return counts
+
+    def order_cost(self, build_order: BuildOrder) -> np.ndarray:
+        """Get the total cost of a build order"""
+        return self.order_counts(build_order) @ self.matrix
+
+class ResourceLedger:
+    """Resource balances of every player in a match, one row per player"""
+
+    def __init__(self, player_ids: Iterable[str], starting_resources: Mapping[str, int],
+                 income: Optional[Mapping[str, int]] = None, cost_table: Optional[CostTable] = None):
+        self.player_ids = list(player_ids)
+        self.rows = {player_id: row for row, player_id in enumerate(self.player_ids)}
+        self.cost_table = cost_table or CostTable()
+        self.balances = np.tile(resource_vector(starting_resources), (len(self.player_ids), 1))
+        self.income = np.tile(resource_vector(income or {}), (len(self.player_ids), 1))
+
+    @classmethod
+    def from_config(cls, config: "GameConfig", player_ids: Iterable[str]) -> "ResourceLedger":
+        """Create a ledger from a match's GameConfig"""
+        return cls(
+            player_ids,
+            config.get("starting_resources", {}),
+            config.get("resource_income", {}),
+            CostTable(config.get("unit_costs", {}))
+        )
+
+    def get_balance(self, player_id: str) -> Dict[str, int]:
+        """Get a player's balance as a resource dict"""
+        return {resource: int(amount) for resource, amount in zip(RESOURCES, self.balances[self.rows[player_id]])}
+
+    def can_afford(self, player_id: str, build_order: BuildOrder) -> bool:
+        """Check if a player can pay for a whole build order"""
+        return bool(np.all(self.cost_table.order_cost(build_order) <= self.balances[self.rows[player_id]]))
+
+    def affordable_prefix(self, player_id: str, build_order: Sequence[Union[UnitType, str]]) -> int:
+        """Get how many units from the start of an ordered build order the player can pay for"""
+        _check_sequence(build_order)
+        if not build_order:
+            return 0
+        rows = self.cost_table.matrix[[_unit_index(unit_type) for unit_type in build_order]]
+        over = np.any(np.cumsum(rows, axis=0) > self.balances[self.rows[player_id]], axis=1)
+        return int(np.argmax(over)) if over.any() else len(build_order)
+
+    def purchase(self, player_id: str, build_order: BuildOrder) -> bool:
+        """Pay for a whole build order, or nothing if the player cannot afford it"""
+        return self.purchase_batch({player_id: build_order})[player_id]
+
+    def purchase_batch(self, build_orders: Mapping[str, BuildOrder]) -> Dict[str, bool]:
+        """Pay for several players' build orders at once, each all-or-nothing"""
+        player_ids = list(build_orders)
+        if not player_ids:
+            return {}
+        rows = [self.rows[player_id] for player_id in player_ids]
+        counts = np.stack([self.cost_table.order_counts(build_orders[player_id]) for player_id in player_ids])
+        costs = counts @ self.cost_table.matrix
+        affordable = np.all(costs <= self.balances[rows], axis=1)
+        self.balances[rows] -= costs * affordable[:, None]
+        return {player_id: bool(ok) for player_id, ok in zip(player_ids, affordable)}
+
+    def apply_income(self) -> None:
+        """Add one turn of income to every player"""
+        self.balances += self.income
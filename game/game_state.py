@@ -1,18 +1,33 @@
 from typing import Dict, Optional, List
 from .player import Player
 from .map import GameMap
+from .map_definitions import MapDefinitions
 from .unit import Unit
+from .scheduler import TurnScheduler
+from utils.profiler import instrumentation
 
 class GameState:
-    def __init__(self, width: int = 10, height: int = 10):
-        self.map = GameMap(width, height)
+    def __init__(self, width: int = 10, height: int = 10, map_name: Optional[str] = None,
+                 scheduler: Optional[TurnScheduler] = None):
+        if map_name is None:
+            self.map = GameMap.from_definition(MapDefinitions.generate_map(width, height))
+        else:
+            self.map = GameMap(map_name)
         self.players: Dict[str, Player] = {}
         self.current_player_id: Optional[str] = None
         self.turn_number: int = 0
         self.game_over: bool = False
+        self.influence_map = None
+        self.scheduler = scheduler or TurnScheduler()
         
     def add_player(self, player: Player) -> None:
         self.players[player.player_id] = player
+        self.scheduler.add_player(player.player_id)
+        if self.influence_map is not None:
+            # The grids were built without this player's units
+            for unit in player.units:
+                self.influence_map.add_unit(unit)
+            self._track_player(player)
         if self.current_player_id is None:
             self.current_player_id = player.player_id
             
@@ -27,12 +42,42 @@ class GameState:
         if not self.map.is_valid_position(new_position):
             return False
         unit.position = new_position
+        instrumentation.count('unit_moves')
+        if self.influence_map is not None:
+            self.influence_map.update_unit(unit)
         return True
         
+    def enable_influence_map(self):
+        """Build influence and threat grids for all units, kept up to date as
+        units are added, removed, moved, killed or buffed"""
+        # Imported here so numpy is only loaded by games that use the grids
+        from .influence import InfluenceMap
+        units = [unit for player in self.players.values() for unit in player.units]
+        self.influence_map = InfluenceMap(self.map, units)
+        for player in self.players.values():
+            self._track_player(player)
+        return self.influence_map
+        
+    def _track_player(self, player: Player) -> None:
+        influence_map = self.influence_map
+        
+        def unit_added(unit: Unit) -> None:
+            unit.on_change = influence_map.update_unit
+            influence_map.add_unit(unit)
+            
+        def unit_removed(unit: Unit) -> None:
+            unit.on_change = None
+            influence_map.remove_unit(unit)
+            
+        player.on_unit_added = unit_added
+        player.on_unit_removed = unit_removed
+        for unit in player.units:
+            unit.on_change = influence_map.update_unit
+        
     def next_turn(self) -> None:
-        player_ids = list(self.players.keys())
-        current_index = player_ids.index(self.current_player_id)
-        next_index = (current_index + 1) % len(player_ids)
-        self.current_player_id = player_ids[next_index]
-        if next_index == 0:
-            self.turn_number += 1 
\ No newline at end of file
+        # Label the turn that is ending, before the scheduler moves on
+        label = f"{self.turn_number}:{self.current_player_id}" if instrumentation.enabled else None
+        with instrumentation.timer('next_turn'):
+            self.scheduler.next_turn(self)
+        if instrumentation.enabled:
+            instrumentation.end_turn(label)
\ No newline at end of file
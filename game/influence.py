@@ -0,0 +1,178 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from .map import GameMap
+from .unit import Unit, UnitStatus
+
+@lru_cache(maxsize=None)
+def threat_kernel(radius: int) -> np.ndarray:
+    """Diamond of ones covering every cell within Manhattan distance radius"""
+    offsets = np.arange(-radius, radius + 1)
+    distance = np.abs(offsets)[:, None] + np.abs(offsets)[None, :]
+    kernel = (distance <= radius).astype(np.float64)
+    kernel.flags.writeable = False
+    return kernel
+
+@lru_cache(maxsize=None)
+def influence_kernel(radius: int) -> np.ndarray:
+    """Diamond falling off linearly from 1 at the centre to 0 past radius"""
+    offsets = np.arange(-radius, radius + 1)
+    distance = np.abs(offsets)[:, None] + np.abs(offsets)[None, :]
+    kernel = np.clip((radius + 1 - distance) / (radius + 1), 0.0, None)
+    kernel.flags.writeable = False
+    return kernel
+
+def convolve(grid: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Same-size 2D convolution of grid with an odd square kernel, zero padded"""
+    radius = kernel.shape[0] // 2
+    height, width = grid.shape
+    padded = np.pad(grid, radius)
+    result = np.zeros_like(grid, dtype=np.float64)
+    for ky, kx in zip(*np.nonzero(kernel)):
+        result += kernel[ky, kx] * padded[ky:ky + height, kx:kx + width]
+    return result
+
+class InfluenceMap:
+    """Per-player influence and threat grids over a GameMap.
+
+    A unit's strength is its total attack scaled by the combat modifier of the
+    terrain it stands on. Its reach is movement plus maximum range, measured
+    as Manhattan distance without pathing. The threat grid adds the unit's
+    strength to every cell it could attack next turn; the influence grid
+    spreads the strength with a linear falloff over the same area.
+
+    Grids are indexed [y, x]. Moving, buffing or killing a unit only
+    re-stamps that unit through update_unit; GameState.enable_influence_map
+    wires this up automatically.
+    """
+
+    def __init__(self, game_map: GameMap, units: Iterable[Unit] = ()):
+        self.game_map = game_map
+        self.shape = (game_map.height, game_map.width)
+        self.threat: Dict[str, np.ndarray] = {}
+        self.influence: Dict[str, np.ndarray] = {}
+        self.total_threat = np.zeros(self.shape)
+        self.total_influence = np.zeros(self.shape)
+        # unit_id -> (player_id, position, strength, reach) of the applied stamp
+        self._stamps: Dict[str, Tuple[str, Tuple[int, int], float, int]] = {}
+        self.rebuild(units)
+
+    def get_unit_strength(self, unit: Unit) -> float:
+        """Get a unit's attack strength on its current terrain"""
+        if unit.status == UnitStatus.DEAD:
+            return 0.0
+        return unit.get_total_attack() * self.game_map.get_combat_modifier(unit.unit_type, unit.position)
+
+    def get_unit_reach(self, unit: Unit) -> int:
+        """Get the distance a unit can attack at after moving"""
+        return unit.movement + unit.range[1]
+
+    def _player_grids(self, player_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        if player_id not in self.threat:
+            self.threat[player_id] = np.zeros(self.shape)
+            self.influence[player_id] = np.zeros(self.shape)
+        return self.threat[player_id], self.influence[player_id]
+
+    def _stamp(self, grids: Iterable[np.ndarray], kernel: np.ndarray,
+               position: Tuple[int, int], scale: float) -> None:
+        radius = kernel.shape[0] // 2
+        height, width = self.shape
+        x, y = position
+        x0, x1 = max(0, x - radius), min(width, x + radius + 1)
+        y0, y1 = max(0, y - radius), min(height, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        patch = scale * kernel[y0 - y + radius:y1 - y + radius, x0 - x + radius:x1 - x + radius]
+        for grid in grids:
+            grid[y0:y1, x0:x1] += patch
+
+    def _apply(self, player_id: str, position: Tuple[int, int], strength: float, reach: int, sign: int) -> None:
+        threat, influence = self._player_grids(player_id)
+        self._stamp((threat, self.total_threat), threat_kernel(reach), position, sign * strength)
+        self._stamp((influence, self.total_influence), influence_kernel(reach), position, sign * strength)
+
+    def add_unit(self, unit: Unit) -> None:
+        """Stamp a unit onto the grids"""
+        if unit.unit_id in self._stamps:
+            self.remove_unit(unit)
+        strength = self.get_unit_strength(unit)
+        if strength <= 0:
+            return
+        stamp = (unit.player_id, unit.position, strength, self.get_unit_reach(unit))
+        self._apply(*stamp, 1)
+        self._stamps[unit.unit_id] = stamp
+
+    def remove_unit(self, unit: Unit) -> None:
+        """Remove a unit's stamp, as applied when it was last added"""
+        stamp = self._stamps.pop(unit.unit_id, None)
+        if stamp is not None:
+            self._apply(*stamp, -1)
+
+    def update_unit(self, unit: Unit) -> None:
+        """Re-stamp a unit after it moved, died or had its buffs changed"""
+        self.add_unit(unit)
+
+    def rebuild(self, units: Iterable[Unit]) -> None:
+        """Recompute all grids from scratch, one convolution per player and reach"""
+        self.threat.clear()
+        self.influence.clear()
+        self.total_threat[:] = 0
+        self.total_influence[:] = 0
+        self._stamps.clear()
+
+        # (player_id, reach) -> grid of summed strengths at unit positions
+        sources: Dict[Tuple[str, int], np.ndarray] = {}
+        for unit in units:
+            strength = self.get_unit_strength(unit)
+            if strength <= 0 or not self.game_map.is_valid_position(unit.position):
+                continue
+            reach = self.get_unit_reach(unit)
+            source = sources.get((unit.player_id, reach))
+            if source is None:
+                source = sources[(unit.player_id, reach)] = np.zeros(self.shape)
+            x, y = unit.position
+            source[y, x] += strength
+            self._stamps[unit.unit_id] = (unit.player_id, unit.position, strength, reach)
+
+        for (player_id, reach), source in sources.items():
+            threat, influence = self._player_grids(player_id)
+            threat += convolve(source, threat_kernel(reach))
+            influence += convolve(source, influence_kernel(reach))
+        for player_id in self.threat:
+            self.total_threat += self.threat[player_id]
+            self.total_influence += self.influence[player_id]
+
+    def get_threat(self, position: Tuple[int, int], player_id: str) -> float:
+        """Get the summed strength of enemy units able to attack a cell"""
+        if not self.game_map.is_valid_position(position):
+            return 0.0
+        x, y = position
+        own = self.threat.get(player_id)
+        return float(self.total_threat[y, x] - (own[y, x] if own is not None else 0.0))
+
+    def is_threatened(self, position: Tuple[int, int], player_id: str) -> bool:
+        """Check if any enemy unit could attack the cell next turn"""
+        # Tolerance for rounding left behind by adding and removing stamps
+        return self.get_threat(position, player_id) > 1e-6
+
+    def get_influence(self, position: Tuple[int, int], player_id: str) -> float:
+        """Get the player's influence at a cell minus that of all enemies"""
+        if not self.game_map.is_valid_position(position):
+            return 0.0
+        x, y = position
+        own = self.influence.get(player_id)
+        own_value = own[y, x] if own is not None else 0.0
+        return float(2 * own_value - self.total_influence[y, x])
+
+    def get_enemy_influence_map(self, player_id: str) -> np.ndarray:
+        """Get the summed influence grid of all enemies of the player"""
+        own = self.influence.get(player_id)
+        return self.total_influence - own if own is not None else self.total_influence.copy()
+
+    def get_strongest_enemy_position(self, player_id: str) -> Optional[Tuple[int, int]]:
+        """Get the cell where enemy influence is concentrated the most"""
+        enemy = self.get_enemy_influence_map(player_id)
+        if not enemy.any():
+            return None
+        y, x = np.unravel_index(int(np.argmax(enemy)), enemy.shape)
+        return (int(x), int(y))
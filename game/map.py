@@ -3,81 +3,87 @@ from enum import Enum
 from .unit import Unit, UnitType
 from .map_definitions import MapDefinitions
 from .unit import TerrainType
+from utils.profiler import instrument
+from utils.lazy import lazy_table
 
 class TerrainEffects:
     """Defines how different terrains affect units"""
     
     # Movement cost multipliers for each terrain type
-    MOVEMENT_COSTS = {
-        TerrainType.LAND: {
-            UnitType.INFANTRY: 1.0,
-            UnitType.CAVALRY: 1.0,
-            UnitType.ARCHER: 1.0,
-            UnitType.SIEGE: 1.5,
-            UnitType.NAVAL: float('inf'),  # Cannot move on land
-            UnitType.AIRCRAFT: 1.0
-        },
-        TerrainType.WATER: {
-            UnitType.INFANTRY: float('inf'),  # Cannot move on water
-            UnitType.CAVALRY: float('inf'),
-            UnitType.ARCHER: float('inf'),
-            UnitType.SIEGE: float('inf'),
-            UnitType.NAVAL: 1.0,
-            UnitType.AIRCRAFT: 1.0
-        },
-        TerrainType.MOUNTAIN: {
-            UnitType.INFANTRY: 2.0,
-            UnitType.CAVALRY: 3.0,
-            UnitType.ARCHER: 2.0,
-            UnitType.SIEGE: float('inf'),  # Cannot move on mountains
-            UnitType.NAVAL: float('inf'),
-            UnitType.AIRCRAFT: 1.0
-        },
-        TerrainType.FOREST: {
-            UnitType.INFANTRY: 1.5,
-            UnitType.CAVALRY: 2.0,
-            UnitType.ARCHER: 1.5,
-            UnitType.SIEGE: 2.5,
-            UnitType.NAVAL: float('inf'),
-            UnitType.AIRCRAFT: 1.0
-        },
-        TerrainType.AIR: {
-            UnitType.INFANTRY: float('inf'),
-            UnitType.CAVALRY: float('inf'),
-            UnitType.ARCHER: float('inf'),
-            UnitType.SIEGE: float('inf'),
-            UnitType.NAVAL: float('inf'),
-            UnitType.AIRCRAFT: 1.0
+    @lazy_table
+    def MOVEMENT_COSTS(cls) -> Dict[TerrainType, Dict[UnitType, float]]:
+        return {
+            TerrainType.LAND: {
+                UnitType.INFANTRY: 1.0,
+                UnitType.CAVALRY: 1.0,
+                UnitType.ARCHER: 1.0,
+                UnitType.SIEGE: 1.5,
+                UnitType.NAVAL: float('inf'),  # Cannot move on land
+                UnitType.AIRCRAFT: 1.0
+            },
+            TerrainType.WATER: {
+                UnitType.INFANTRY: float('inf'),  # Cannot move on water
+                UnitType.CAVALRY: float('inf'),
+                UnitType.ARCHER: float('inf'),
+                UnitType.SIEGE: float('inf'),
+                UnitType.NAVAL: 1.0,
+                UnitType.AIRCRAFT: 1.0
+            },
+            TerrainType.MOUNTAIN: {
+                UnitType.INFANTRY: 2.0,
+                UnitType.CAVALRY: 3.0,
+                UnitType.ARCHER: 2.0,
+                UnitType.SIEGE: float('inf'),  # Cannot move on mountains
+                UnitType.NAVAL: float('inf'),
+                UnitType.AIRCRAFT: 1.0
+            },
+            TerrainType.FOREST: {
+                UnitType.INFANTRY: 1.5,
+                UnitType.CAVALRY: 2.0,
+                UnitType.ARCHER: 1.5,
+                UnitType.SIEGE: 2.5,
+                UnitType.NAVAL: float('inf'),
+                UnitType.AIRCRAFT: 1.0
+            },
+            TerrainType.AIR: {
+                UnitType.INFANTRY: float('inf'),
+                UnitType.CAVALRY: float('inf'),
+                UnitType.ARCHER: float('inf'),
+                UnitType.SIEGE: float('inf'),
+                UnitType.NAVAL: float('inf'),
+                UnitType.AIRCRAFT: 1.0
+            }
         }
-    }
     
     # Combat modifiers for each terrain type
-    COMBAT_MODIFIERS = {
-        TerrainType.LAND: {
-            UnitType.INFANTRY: 1.0,
-            UnitType.CAVALRY: 1.0,
-            UnitType.ARCHER: 1.0,
-            UnitType.SIEGE: 1.0,
-            UnitType.NAVAL: 0.5,
-            UnitType.AIRCRAFT: 1.0
-        },
-        TerrainType.MOUNTAIN: {
-            UnitType.INFANTRY: 1.2,  # Infantry gets bonus on mountains
-            UnitType.CAVALRY: 0.7,   # Cavalry is less effective
-            UnitType.ARCHER: 1.3,    # Archers get height advantage
-            UnitType.SIEGE: 0.5,
-            UnitType.NAVAL: 0.0,
-            UnitType.AIRCRAFT: 0.8
-        },
-        TerrainType.FOREST: {
-            UnitType.INFANTRY: 1.1,  # Infantry slight bonus in forests
-            UnitType.CAVALRY: 0.8,   # Cavalry penalty in forests
-            UnitType.ARCHER: 0.7,    # Archers have reduced visibility
-            UnitType.SIEGE: 0.6,
-            UnitType.NAVAL: 0.0,
-            UnitType.AIRCRAFT: 0.9
+    @lazy_table
+    def COMBAT_MODIFIERS(cls) -> Dict[TerrainType, Dict[UnitType, float]]:
+        return {
+            TerrainType.LAND: {
+                UnitType.INFANTRY: 1.0,
+                UnitType.CAVALRY: 1.0,
+                UnitType.ARCHER: 1.0,
+                UnitType.SIEGE: 1.0,
+                UnitType.NAVAL: 0.5,
+                UnitType.AIRCRAFT: 1.0
+            },
+            TerrainType.MOUNTAIN: {
+                UnitType.INFANTRY: 1.2,  # Infantry gets bonus on mountains
+                UnitType.CAVALRY: 0.7,   # Cavalry is less effective
+                UnitType.ARCHER: 1.3,    # Archers get height advantage
+                UnitType.SIEGE: 0.5,
+                UnitType.NAVAL: 0.0,
+                UnitType.AIRCRAFT: 0.8
+            },
+            TerrainType.FOREST: {
+                UnitType.INFANTRY: 1.1,  # Infantry slight bonus in forests
+                UnitType.CAVALRY: 0.8,   # Cavalry penalty in forests
+                UnitType.ARCHER: 0.7,    # Archers have reduced visibility
+                UnitType.SIEGE: 0.6,
+                UnitType.NAVAL: 0.0,
+                UnitType.AIRCRAFT: 0.9
+            }
         }
-    }
 
 class GameMap:
     def __init__(self, map_name: str = "small_duel"):
@@ -86,6 +92,17 @@ class GameMap:
         self.width, self.height = MapDefinitions.get_map_size(map_name)
         self.terrain: List[List[TerrainType]] = MapDefinitions.get_terrain_map(map_name)
         self.spawn_points = MapDefinitions.get_spawn_points(map_name)
+    
+    @classmethod
+    def from_definition(cls, definition: Dict) -> "GameMap":
+        """Create a map from a definition in the MapDefinitions.MAPS format,
+        such as one made by MapDefinitions.generate_map"""
+        game_map = cls.__new__(cls)
+        game_map.map_name = definition["name"]
+        game_map.width, game_map.height = definition["size"]
+        game_map.terrain = MapDefinitions.parse_terrain(definition["terrain"])
+        game_map.spawn_points = definition["spawn_points"]
+        return game_map
         
     def get_player_spawn_points(self, player_id: str) -> List[Tuple[int, int]]:
         """Get valid spawn points for a player"""
@@ -137,6 +154,7 @@ class GameMap:
         movement_cost = self.get_movement_cost(unit.unit_type, target_position)
         return movement_cost < float('inf')
     
+    @instrument('move_generation')
     def get_valid_moves(self, unit: Unit) -> List[Tuple[int, int]]:
         """Get all valid positions a unit can move to"""
         valid_moves = []
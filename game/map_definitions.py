@@ -1,4 +1,5 @@
-from typing import Dict, List
+import random
+from typing import Dict, List, Optional
 from .unit import TerrainType
 class MapDefinitions:
     """Predefined map layouts for the game"""
@@ -78,7 +79,11 @@ class MapDefinitions:
         if map_name not in cls.MAPS:
             raise ValueError(f"Map '{map_name}' not found")
             
-        map_data = cls.MAPS[map_name]
+        return cls.parse_terrain(cls.MAPS[map_name]["terrain"])
+    
+    @staticmethod
+    def parse_terrain(rows: List[str]) -> List[List[TerrainType]]:
+        """Convert terrain rows such as "LLFW" to a TerrainType map"""
         terrain_map = []
         
         terrain_conversion = {
@@ -89,7 +94,7 @@ class MapDefinitions:
             'A': TerrainType.AIR
         }
         
-        for row in map_data["terrain"]:
+        for row in rows:
             terrain_row = [terrain_conversion[char] for char in row]
             terrain_map.append(terrain_row)
             
@@ -107,4 +112,35 @@ class MapDefinitions:
         """Get the size of the specified map"""
         if map_name not in cls.MAPS:
             raise ValueError(f"Map '{map_name}' not found")
-        return cls.MAPS[map_name]["size"] 
\ No newline at end of file
+        return cls.MAPS[map_name]["size"]
+    
+    @classmethod
+    def generate_map(cls, width: int, height: int, seed: int = 0, name: Optional[str] = None) -> Dict:
+        """Generate a random map definition in the same format as MAPS entries.
+
+        The definition is not added to MAPS; load it with
+        GameMap.from_definition. Terrain is mostly land; spawn points are the
+        opposite corners.
+        """
+        name = name or f"generated_{width}x{height}_{seed}"
+        rng = random.Random(seed)
+        terrain = ["".join(rng.choices("LWMF", weights=(6, 2, 1, 1), k=width)) for _ in range(height)]
+        
+        # Keep the spawn corners walkable for ground units
+        corners = {
+            "player1": [(0, 0), (1, 0), (0, 1)],
+            "player2": [(width - 1, height - 1), (width - 2, height - 1), (width - 1, height - 2)]
+        }
+        spawn_points = {}
+        for player_id, points in corners.items():
+            spawn_points[player_id] = [(x, y) for x, y in points if 0 <= x < width and 0 <= y < height]
+            for x, y in spawn_points[player_id]:
+                terrain[y] = terrain[y][:x] + "L" + terrain[y][x + 1:]
+                
+        return {
+            "name": name,
+            "description": f"Generated {width}x{height} map",
+            "size": (width, height),
+            "terrain": terrain,
+            "spawn_points": spawn_points
+        }
@@ -0,0 +1,37 @@
+from typing import Callable, Dict, List, Optional
+from .unit import Unit, UnitStatus
+
+class Player:
+    def __init__(self, player_id: str, name: str, resources: Optional[Dict[str, int]] = None):
+        self.player_id = player_id
+        self.name = name
+        self.units: List[Unit] = []
+        self.resources: Dict[str, int] = dict(resources or {})
+        # Called with the unit whenever one joins or leaves the army
+        self.on_unit_added: Optional[Callable[[Unit], None]] = None
+        self.on_unit_removed: Optional[Callable[[Unit], None]] = None
+
+    def add_unit(self, unit: Unit) -> None:
+        """Add a unit to the player's army"""
+        self.units.append(unit)
+        if self.on_unit_added is not None:
+            self.on_unit_added(unit)
+
+    def remove_unit(self, unit: Unit) -> None:
+        """Remove a unit from the player's army"""
+        self.units.remove(unit)
+        if self.on_unit_removed is not None:
+            self.on_unit_removed(unit)
+
+    def get_alive_units(self) -> List[Unit]:
+        """Get all units that are not dead"""
+        return [unit for unit in self.units if unit.status != UnitStatus.DEAD]
+
+    def to_dict(self) -> Dict:
+        """Convert player to dictionary representation"""
+        return {
+            'player_id': self.player_id,
+            'name': self.name,
+            'resources': self.resources,
+            'units': [unit.to_dict() for unit in self.units]
+        }
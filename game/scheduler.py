@@ -0,0 +1,220 @@
+import heapq
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from utils.profiler import instrumentation
+from .unit import Unit, UnitStatus
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+class SchedulingMode(Enum):
+    ROTATION = "rotation"          # players alternate in the order they joined
+    INITIATIVE = "initiative"      # single units act in order of speed
+    SIMULTANEOUS = "simultaneous"  # all players submit orders, resolved together
+
+@dataclass
+class Order:
+    """A unit order submitted for a simultaneous turn"""
+    unit_id: str
+    action: str  # "move" or "attack"
+    target: Tuple[int, int]
+
+@dataclass
+class Resolution:
+    """Outcome of resolving one simultaneous turn"""
+    moved: List[str] = field(default_factory=list)
+    blocked: List[str] = field(default_factory=list)
+    attacks: List[Tuple[str, str, int]] = field(default_factory=list)  # (attacker, target, damage)
+
+# A player's script: given the state and the player id, returns that player's orders
+Script = Callable[["GameState", str], List[Order]]
+
+class TurnScheduler:
+    """Decides who acts next.
+
+    The player rotation is precomputed when players join, so advancing a
+    rotation turn is a dict lookup from the state's current player.
+    """
+
+    def __init__(self, mode: SchedulingMode = SchedulingMode.ROTATION):
+        self.mode = mode
+        self.rotation: Tuple[str, ...] = ()
+        # player_id -> rotation index of the player acting after them
+        self.next_index: Dict[str, int] = {}
+        # Initiative mode: heap of (-speed, player order, unit order, unit)
+        self.initiative_queue: List[Tuple[int, int, int, Unit]] = []
+        self.current_unit: Optional[Unit] = None
+        # Simultaneous mode: orders submitted for the coming resolution
+        self.orders: Dict[str, List[Order]] = {}
+
+    def add_player(self, player_id: str) -> None:
+        """Add a player to the end of the rotation"""
+        if player_id not in self.rotation:
+            self.rotation = self.rotation + (player_id,)
+            self.next_index = {
+                rotation_id: (index + 1) % len(self.rotation) for index, rotation_id in enumerate(self.rotation)
+            }
+
+    def get_initiative(self, unit: Unit) -> int:
+        """Get a unit's speed; faster units act first"""
+        return unit.movement
+
+    def next_turn(self, state: "GameState") -> None:
+        """Advance the state to the next actor"""
+        if self.mode == SchedulingMode.INITIATIVE:
+            self._next_initiative(state)
+        elif self.mode == SchedulingMode.SIMULTANEOUS:
+            self.resolve(state)
+            state.turn_number += 1
+        elif self.rotation:
+            next_index = self.next_index.get(state.current_player_id)
+            if next_index is None:
+                raise ValueError(f"Current player {state.current_player_id!r} is not in the rotation")
+            state.current_player_id = self.rotation[next_index]
+            if next_index == 0:
+                state.turn_number += 1
+        else:
+            # No players, so there is nobody to hand the turn to
+            return
+
+    # Initiative mode
+
+    def start_round(self, state: "GameState") -> None:
+        """Queue every living unit for a new round of initiative turns"""
+        queue = []
+        for player_order, player_id in enumerate(self.rotation):
+            for unit_order, unit in enumerate(state.players[player_id].units):
+                if unit.status != UnitStatus.DEAD:
+                    # (player order, unit order) is unique, so units themselves are never compared
+                    queue.append((-self.get_initiative(unit), player_order, unit_order, unit))
+        heapq.heapify(queue)
+        self.initiative_queue = queue
+
+    def _next_initiative(self, state: "GameState") -> None:
+        while True:
+            while self.initiative_queue:
+                unit = heapq.heappop(self.initiative_queue)[3]
+                # Units killed earlier in the round lose their turn
+                if unit.status != UnitStatus.DEAD:
+                    self.current_unit = unit
+                    state.current_player_id = unit.player_id
+                    return
+            if self.current_unit is not None:
+                state.turn_number += 1
+            self.start_round(state)
+            if not self.initiative_queue:
+                self.current_unit = None
+                return
+
+    # Simultaneous mode
+
+    def submit_orders(self, player_id: str, orders: List[Order]) -> None:
+        """Set a player's orders for the coming resolution"""
+        self.orders[player_id] = list(orders)
+
+    def run_scripts(self, state: "GameState", scripts: Dict[str, Script],
+                    executor: Optional[Executor] = None) -> Dict[str, List[Order]]:
+        """Run every player's script concurrently and submit the returned orders.
+
+        Scripts only read the state; it is not changed until resolve(). Pass a
+        ProcessPoolExecutor to run CPU-bound scripts in separate processes, in
+        which case scripts must be picklable module-level functions.
+        """
+        own_executor = executor is None
+        executor = executor or ThreadPoolExecutor(max_workers=max(1, len(scripts)))
+        try:
+            with instrumentation.timer('script_execution'):
+                futures = {player_id: executor.submit(script, state, player_id) for player_id, script in scripts.items()}
+                results = {player_id: future.result() for player_id, future in futures.items()}
+        finally:
+            if own_executor:
+                executor.shutdown()
+        for player_id, orders in results.items():
+            self.submit_orders(player_id, orders)
+        return results
+
+    def resolve(self, state: "GameState") -> Resolution:
+        """Apply all submitted orders at once.
+
+        Every living unit starts the turn ready. Moves go first; a move
+        further than the unit's movement is blocked. When several units head
+        for the same cell the one with the highest initiative gets it (then
+        rotation order, then submission order); moves into a cell whose
+        occupant stays put are blocked. Attacks are then resolved against the
+        new positions, with all damage worked out before any is applied. Each
+        unit attacks at most once, with its first attack order. Units that
+        moved or attacked are left MOVED or ATTACKED.
+        """
+        units = self._index_units(state)
+        for unit in units.values():
+            unit.clear_status()
+        result = Resolution()
+        moves: Dict[str, Tuple[Tuple[int, int], Tuple[int, int, int]]] = {}
+        attacks: List[Tuple[Unit, Tuple[int, int]]] = []
+
+        for player_order, player_id in enumerate(self.rotation):
+            for order_index, order in enumerate(self.orders.get(player_id, [])):
+                unit = units.get(order.unit_id)
+                if unit is None or unit.player_id != player_id or unit.status == UnitStatus.DEAD:
+                    continue
+                if order.action == "move":
+                    if (unit.can_move() and unit._calculate_distance(order.target) <= unit.movement
+                            and state.map.can_unit_move_to(unit, order.target)):
+                        priority = (-self.get_initiative(unit), player_order, order_index)
+                        moves[unit.unit_id] = (order.target, priority)
+                    else:
+                        result.blocked.append(unit.unit_id)
+                elif order.action == "attack":
+                    attacks.append((unit, order.target))
+        self.orders = {}
+
+        # Settle contested cells until no accepted move enters a cell that stays occupied
+        accepted = self._pick_move_winners(moves, result)
+        while True:
+            staying = {
+                unit.position for unit in units.values()
+                if unit.status != UnitStatus.DEAD and unit.unit_id not in accepted
+            }
+            bounced = [unit_id for unit_id, target in accepted.items() if target in staying]
+            if not bounced:
+                break
+            for unit_id in bounced:
+                del accepted[unit_id]
+                result.blocked.append(unit_id)
+
+        for unit_id, target in accepted.items():
+            state.update_unit_position(units[unit_id], target)
+            units[unit_id].status = UnitStatus.MOVED
+            result.moved.append(unit_id)
+
+        occupants = {unit.position: unit for unit in units.values() if unit.status != UnitStatus.DEAD}
+        hits = []
+        for attacker, target_position in attacks:
+            target = occupants.get(target_position)
+            if target is None or target.player_id == attacker.player_id or not attacker.can_attack(target_position):
+                continue
+            # Set before any damage lands, so a unit killed this turn still ends up DEAD
+            attacker.status = UnitStatus.ATTACKED
+            hits.append((attacker, target, attacker.get_total_attack()))
+        for attacker, target, damage in hits:
+            health = target.health
+            target.take_damage(damage)
+            result.attacks.append((attacker.unit_id, target.unit_id, health - target.health))
+        return result
+
+    def _pick_move_winners(self, moves: Dict, result: Resolution) -> Dict[str, Tuple[int, int]]:
+        best: Dict[Tuple[int, int], Tuple[Tuple[int, int, int], str]] = {}
+        for unit_id, (target, priority) in moves.items():
+            current = best.get(target)
+            if current is None or priority < current[0]:
+                if current is not None:
+                    result.blocked.append(current[1])
+                best[target] = (priority, unit_id)
+            else:
+                result.blocked.append(unit_id)
+        return {unit_id: target for target, (_, unit_id) in best.items()}
+
+    def _index_units(self, state: "GameState") -> Dict[str, Unit]:
+        return {unit.unit_id: unit for player in state.players.values() for unit in player.units}
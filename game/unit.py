@@ -1,6 +1,8 @@
 from enum import Enum
-from typing import Tuple, Dict, Optional, List
+from typing import Callable, Tuple, Dict, Optional, List
 from dataclasses import dataclass
+from utils.profiler import instrument
+from utils.lazy import lazy_table
 
 class UnitType(Enum):
     INFANTRY = "infantry"
@@ -24,62 +26,64 @@ class UnitStats:
 class UnitStatistics:
     """Defines base statistics for all unit types"""
     
-    BASE_STATS = {
-        UnitType.INFANTRY: UnitStats(
-            health=100,
-            attack=10,
-            defense=10,
-            movement=2,
-            range=(1, 1),
-            vision=3,
-            cost={"gold": 100, "food": 50}
-        ),
-        UnitType.CAVALRY: UnitStats(
-            health=120,
-            attack=15,
-            defense=8,
-            movement=4,
-            range=(1, 1),
-            vision=4,
-            cost={"gold": 200, "food": 75}
-        ),
-        UnitType.ARCHER: UnitStats(
-            health=80,
-            attack=12,
-            defense=5,
-            movement=2,
-            range=(2, 4),
-            vision=5,
-            cost={"gold": 150, "food": 50}
-        ),
-        UnitType.SIEGE: UnitStats(
-            health=150,
-            attack=20,
-            defense=15,
-            movement=1,
-            range=(2, 5),
-            vision=2,
-            cost={"gold": 300, "wood": 100, "iron": 50}
-        ),
-        UnitType.NAVAL: UnitStats(
-            health=200,
-            attack=15,
-            defense=12,
-            movement=3,
-            range=(1, 3),
-            vision=4,
-            cost={"gold": 250, "wood": 150}
-        ),
-        UnitType.AIRCRAFT: UnitStats(
-            health=100,
-            attack=15,
-            defense=5,
-            movement=5,
-            range=(1, 4),
-            vision=6,
-            cost={"gold": 300, "iron": 100}
-        )
-    }
+    @lazy_table
+    def BASE_STATS(cls) -> Dict[UnitType, UnitStats]:
+        return {
+            UnitType.INFANTRY: UnitStats(
+                health=100,
+                attack=10,
+                defense=10,
+                movement=2,
+                range=(1, 1),
+                vision=3,
+                cost={"gold": 100, "food": 50}
+            ),
+            UnitType.CAVALRY: UnitStats(
+                health=120,
+                attack=15,
+                defense=8,
+                movement=4,
+                range=(1, 1),
+                vision=4,
+                cost={"gold": 200, "food": 75}
+            ),
+            UnitType.ARCHER: UnitStats(
+                health=80,
+                attack=12,
+                defense=5,
+                movement=2,
+                range=(2, 4),
+                vision=5,
+                cost={"gold": 150, "food": 50}
+            ),
+            UnitType.SIEGE: UnitStats(
+                health=150,
+                attack=20,
+                defense=15,
+                movement=1,
+                range=(2, 5),
+                vision=2,
+                cost={"gold": 300, "wood": 100, "iron": 50}
+            ),
+            UnitType.NAVAL: UnitStats(
+                health=200,
+                attack=15,
+                defense=12,
+                movement=3,
+                range=(1, 3),
+                vision=4,
+                cost={"gold": 250, "wood": 150}
+            ),
+            UnitType.AIRCRAFT: UnitStats(
+                health=100,
+                attack=15,
+                defense=5,
+                movement=5,
+                range=(1, 4),
+                vision=6,
+                cost={"gold": 300, "iron": 100}
+            )
+        }
 
 class UnitStatus(Enum):
     READY = "ready"
@@ -111,13 +115,19 @@ class Unit:
         self.level = 1
         self.buffs: List[Dict] = []
         self.debuffs: List[Dict] = []
+        
+        # Called with the unit when it dies or its buffs/debuffs change
+        self.on_change: Optional[Callable[["Unit"], None]] = None
 
+    @instrument('combat')
     def take_damage(self, damage: int) -> None:
         """Apply damage to the unit, considering defense"""
         actual_damage = max(0, damage - self.get_total_defense())
         self.health = max(0, self.health - actual_damage)
-        if self.health == 0:
+        if self.health == 0 and self.status != UnitStatus.DEAD:
             self.status = UnitStatus.DEAD
+            if self.on_change is not None:
+                self.on_change(self)
 
     def heal(self, amount: int) -> None:
         """Heal the unit by the specified amount"""
@@ -170,10 +180,14 @@ class Unit:
     def add_buff(self, buff: Dict) -> None:
         """Add a buff to the unit"""
         self.buffs.append(buff)
+        if self.on_change is not None:
+            self.on_change(self)
 
     def add_debuff(self, debuff: Dict) -> None:
         """Add a debuff to the unit"""
         self.debuffs.append(debuff)
+        if self.on_change is not None:
+            self.on_change(self)
 
     def clear_status(self) -> None:
         """Reset unit status for new turn"""
@@ -1,15 +1,17 @@
-from ui.game_window import GameWindow
 from utils.logger import GameLogger
 
 logger = GameLogger(__name__)
 
 def main():
+    # Imported here so pygame is only loaded when the window is opened
+    from ui import GameWindow
+    
     try:
         # Create game window
         window = GameWindow("Script Game Engine - Map Viewer")
         
         # Load initial map
-        logger.info("Loading map: small_duel")
+        logger.info("Loading map: %s", "small_duel")
         window.load_map("small_duel")
         
         # Start game loop
@@ -17,7 +19,7 @@ def main():
         window.run()
         
     except Exception as e:
-        logger.error(f"Error in main: {str(e)}")
+        logger.error("Error in main: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from game.action import Action
 from game.game_state import GameState
+from utils.profiler import instrument
 
 class ScriptParser:
     def __init__(self):
         self.valid_actions = ["move", "attack", "defend", "heal"]
         
+    @instrument('script_parsing')
     def parse_script(self, script_text: str) -> List[Action]:
         actions = []
         lines = script_text.strip().split('\n')
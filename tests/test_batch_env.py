@@ -0,0 +1,66 @@
+import numpy as np
+from game.batch_env import BatchEnvironment, TERRAIN_TYPES
+from game.unit import TerrainType, Unit, UnitType
+
+def make_duel(num_envs=4):
+    env = BatchEnvironment(num_envs, "mountain_pass", {"player1": [UnitType.ARCHER], "player2": [UnitType.INFANTRY]})
+    # Archer at (2, 2) two cells from the infantry at (4, 2), both on land
+    env.x[:] = [2, 4]
+    env.y[:] = [2, 2]
+    return env
+
+def test_observation_shape():
+    env = BatchEnvironment(3)
+    observation = env.reset()
+    assert observation.shape == (3, len(TERRAIN_TYPES) + 2, 8, 8)
+    assert observation[:, len(TERRAIN_TYPES)].sum() == 3 * 3
+
+def test_combat_matches_unit_damage():
+    env = make_duel()
+    _, rewards, dones, _ = env.step()
+    target = Unit("u", UnitType.INFANTRY, "player2", (4, 2))
+    target.take_damage(Unit("a", UnitType.ARCHER, "player1", (2, 2)).get_total_attack())
+    assert np.all(env.health[:, 1] == target.health)
+    assert np.all(rewards == 100 - target.health)
+    assert not dones.any()
+    assert np.all(env.current_player == 1)
+
+def test_movement_is_clamped_and_blocked_by_terrain():
+    env = make_duel(3)
+    actions = np.zeros((3, 2, 2), dtype=np.int32)
+    env.x[0, 1] = 6
+    actions[0, 0] = (5, 0)   # clamped to the archer's movement of 2
+    env.x[1, 0], env.y[1, 0] = 4, 3
+    actions[1, 0] = (0, 1)   # (4, 4) is water
+    env.x[2, 0], env.y[2, 0] = 1, 0
+    actions[2, 0] = (2, 0)   # the mountain at (2, 0) costs the archer 2
+    env.step(actions)
+    assert env.terrain[1, 4, 4] == TERRAIN_TYPES.index(TerrainType.WATER)
+    assert (env.x[0, 0], env.y[0, 0]) == (4, 2)
+    assert (env.x[1, 0], env.y[1, 0]) == (4, 3)
+    assert (env.x[2, 0], env.y[2, 0]) == (2, 0)
+
+def test_moves_into_occupied_or_contested_cells_are_bounced():
+    env = BatchEnvironment(2, "mountain_pass", {
+        "player1": [UnitType.ARCHER, UnitType.CAVALRY], "player2": [UnitType.INFANTRY]
+    })
+    env.x[:] = [2, 3, 5]
+    env.y[:] = [2, 4, 2]
+    actions = np.zeros((2, 3, 2), dtype=np.int32)
+    actions[0, 0] = (1, 0)   # archer and cavalry both head for (3, 2)
+    actions[0, 1] = (0, -2)
+    env.x[1, 2] = 4
+    actions[1, 0] = (2, 0)   # onto the infantry, which is not moving
+    env.step(actions)
+    assert (env.x[0, 0], env.y[0, 0]) == (2, 2)
+    assert (env.x[0, 1], env.y[0, 1]) == (3, 2)
+    assert (env.x[1, 0], env.y[1, 0]) == (2, 2)
+
+def test_finished_matches_are_reset():
+    env = make_duel()
+    env.health[0, 1] = 1
+    _, _, dones, info = env.step()
+    assert dones.tolist() == [True, False, False, False]
+    assert info["winner"].tolist() == [0, -1, -1, -1]
+    assert env.health[0, 1] == 100
+    assert env.current_player[0] == 0
@@ -0,0 +1,32 @@
+from benchmarks.bench_engine import compare, make_state, play_turn, run_benchmarks, scaling_exponent
+
+def test_make_state_places_units_on_distinct_cells():
+    state = make_state(8, 100)
+    positions = [unit.position for player in state.players.values() for unit in player.units]
+    assert len(set(positions)) == 100
+    assert all(state.map.is_valid_position(position) for position in positions)
+
+def test_headless_turn_advances_player():
+    state = make_state(8, 10)
+    play_turn(state)
+    assert state.current_player_id == "player2"
+
+def test_run_and_compare_against_baseline():
+    report = run_benchmarks([8], [10], names=["get_valid_moves", "get_unit_at_position"], repeat=1, min_time=0.0)
+    assert [result["key"] for result in report["results"]] == [
+        "get_valid_moves[map_size=8]", "get_unit_at_position[unit_count=10]"
+    ]
+    assert compare(report, report, threshold=1.5) == []
+
+    slow_baseline = {"results": [dict(result, min=result["min"] / 10) for result in report["results"]]}
+    assert len(compare(report, slow_baseline, threshold=1.5, noise_floor=0.0)) == 2
+
+def test_scaling_exponent():
+    assert abs(scaling_exponent([(10, 1.0), (100, 100.0), (1000, 10000.0)]) - 2.0) < 1e-9
+
+def test_generated_maps_are_not_registered():
+    from game.map_definitions import MapDefinitions
+    names = set(MapDefinitions.MAPS)
+    state = make_state(16, 10)
+    assert set(MapDefinitions.MAPS) == names
+    assert (state.map.width, state.map.height) == (16, 16)
@@ -0,0 +1,63 @@
+import pytest
+from game.economy import CostTable, ResourceLedger
+from game.unit import UnitStatistics, UnitType
+from utils.config import GameConfig
+
+def make_ledger():
+    return ResourceLedger.from_config(GameConfig(), ["player1", "player2"])
+
+def test_cost_table_uses_unit_statistics():
+    table = CostTable()
+    for unit_type, stats in UnitStatistics.BASE_STATS.items():
+        cost = {resource: amount for resource, amount in table.get_cost(unit_type).items() if amount}
+        assert cost == stats.cost
+
+def test_purchase_is_all_or_nothing():
+    ledger = make_ledger()
+    assert ledger.purchase("player1", {UnitType.INFANTRY: 2, "archer": 1})
+    assert ledger.get_balance("player1") == {"gold": 650, "wood": 500, "iron": 300, "food": 650}
+    assert not ledger.purchase("player1", {UnitType.SIEGE: 3})
+    assert ledger.get_balance("player1")["gold"] == 650
+
+def test_batched_purchase_and_income():
+    ledger = make_ledger()
+    results = ledger.purchase_batch({
+        "player1": [UnitType.CAVALRY, UnitType.CAVALRY],
+        "player2": {UnitType.AIRCRAFT: 4}
+    })
+    assert results == {"player1": True, "player2": False}
+    ledger.apply_income()
+    assert ledger.get_balance("player1")["gold"] == 1000 - 400 + 100
+    assert ledger.get_balance("player2")["gold"] == 1000 + 100
+
+def test_affordable_prefix():
+    ledger = make_ledger()
+    order = [UnitType.SIEGE, UnitType.SIEGE, UnitType.SIEGE, UnitType.INFANTRY]
+    assert ledger.affordable_prefix("player1", order) == 4
+    assert ledger.affordable_prefix("player1", order + [UnitType.SIEGE]) == 4
+    assert ledger.affordable_prefix("player1", [UnitType.SIEGE] * 4) == 3
+    assert ledger.affordable_prefix("player1", [UnitType.INFANTRY]) == 1
+
+def test_empty_batch_and_string_orders():
+    ledger = make_ledger()
+    assert ledger.purchase_batch({}) == {}
+    with pytest.raises(ValueError):
+        ledger.can_afford("player1", "infantry")
+    with pytest.raises(ValueError):
+        ledger.purchase("player1", "infantry")
+    with pytest.raises(ValueError):
+        ledger.affordable_prefix("player1", "infantry")
+    assert ledger.get_balance("player1")["gold"] == 1000
+
+def test_unknown_unit_cost_override():
+    with pytest.raises(ValueError):
+        CostTable({"dragon": {"gold": 1}})
+
+def test_configs_do_not_share_state():
+    custom = GameConfig({"starting_resources": {"gold": 5}, "unit_costs": {"infantry": {"gold": 1}}})
+    default = GameConfig()
+    assert custom.get("starting_resources")["gold"] == 5
+    assert default.get("starting_resources")["gold"] == 1000
+    assert default.get("unit_costs")["infantry"] == {"gold": 100, "food": 50}
+    assert set(default.get("unit_costs")) == {unit_type.value for unit_type in UnitType}
+    assert GameConfig.DEFAULT_CONFIG["unit_costs"] == default.get("unit_costs")
@@ -0,0 +1,102 @@
+import numpy as np
+from game.game_state import GameState
+from game.influence import InfluenceMap, convolve, threat_kernel
+from game.map import GameMap
+from game.player import Player
+from game.unit import Unit, UnitType
+
+def make_units():
+    return [
+        Unit("a1", UnitType.ARCHER, "player1", (1, 1)),
+        Unit("a2", UnitType.INFANTRY, "player1", (2, 0)),
+        Unit("b1", UnitType.CAVALRY, "player2", (6, 6)),
+        Unit("b2", UnitType.SIEGE, "player2", (7, 7))
+    ]
+
+def test_threat_matches_can_attack_scan():
+    game_map = GameMap("mountain_pass")
+    units = make_units()
+    influence = InfluenceMap(game_map, units)
+    enemies = [unit for unit in units if unit.player_id == "player2"]
+    for x in range(game_map.width):
+        for y in range(game_map.height):
+            reachable = any(
+                unit._calculate_distance((x, y)) <= unit.movement + unit.range[1] for unit in enemies
+            )
+            assert influence.is_threatened((x, y), "player1") == reachable
+
+def test_incremental_updates_match_rebuild():
+    game_map = GameMap("mountain_pass")
+    units = make_units()
+    influence = InfluenceMap(game_map, units)
+    units[0].position = (4, 5)
+    influence.update_unit(units[0])
+    units[2].add_buff({"attribute": "attack", "value": 0.5})
+    influence.update_unit(units[2])
+    influence.remove_unit(units[3])
+
+    expected = InfluenceMap(game_map, units[:3])
+    for player_id in ("player1", "player2"):
+        assert np.allclose(influence.threat[player_id], expected.threat[player_id])
+        assert np.allclose(influence.influence[player_id], expected.influence[player_id])
+
+def test_strongest_enemy_position():
+    influence = InfluenceMap(GameMap("mountain_pass"), make_units())
+    assert influence.get_strongest_enemy_position("player2") in [(1, 1), (2, 0), (2, 1), (1, 0)]
+
+def test_convolve_stamps_diamond():
+    grid = np.zeros((5, 5))
+    grid[2, 2] = 2.0
+    assert np.array_equal(convolve(grid, threat_kernel(1)), 2.0 * np.pad(threat_kernel(1), 1))
+
+def test_game_state_moves_update_influence():
+    state = GameState(10, 10)
+    player = Player("player1", "Player 1")
+    unit = Unit("u1", UnitType.INFANTRY, "player1", (0, 0))
+    player.add_unit(unit)
+    state.add_player(player)
+    influence = state.enable_influence_map()
+    assert influence.is_threatened((9, 9), "player2") is False
+    state.update_unit_position(unit, (8, 8))
+    assert influence.is_threatened((9, 9), "player2")
+
+def test_game_state_tracks_deaths_buffs_and_new_units():
+    state = GameState(10, 10)
+    player1, player2 = Player("player1", "Player 1"), Player("player2", "Player 2")
+    state.add_player(player1)
+    state.add_player(player2)
+    archer = Unit("a1", UnitType.ARCHER, "player1", (0, 0))
+    player1.add_unit(archer)
+    influence = state.enable_influence_map()
+    assert influence.get_threat((2, 2), "player2") == 12
+
+    archer.add_buff({"attribute": "attack", "value": 0.5})
+    assert influence.get_threat((2, 2), "player2") == 18
+
+    player2.add_unit(Unit("b1", UnitType.INFANTRY, "player2", (9, 9)))
+    assert influence.is_threatened((8, 8), "player1")
+
+    archer.take_damage(1000)
+    assert not influence.is_threatened((2, 2), "player2")
+
+def test_out_of_bounds_queries():
+    influence = InfluenceMap(GameMap("mountain_pass"), make_units())
+    assert not influence.is_threatened((-1, 0), "player1")
+    assert influence.get_influence((0, 10), "player1") == 0.0
+
+def test_enabling_keeps_the_rebuilt_stamps(monkeypatch):
+    state = GameState(10, 10)
+    player1 = Player("player1", "Player 1")
+    player1.add_unit(Unit("a1", UnitType.ARCHER, "player1", (0, 0)))
+    state.add_player(player1)
+    restamped = []
+    monkeypatch.setattr(InfluenceMap, "add_unit", lambda self, unit: restamped.append(unit.unit_id))
+    state.enable_influence_map()
+    assert restamped == []
+    monkeypatch.undo()
+
+    player2 = Player("player2", "Player 2")
+    player2.add_unit(Unit("b1", UnitType.INFANTRY, "player2", (9, 9)))
+    state.add_player(player2)
+    assert state.influence_map.is_threatened((8, 8), "player1")
+    assert state.influence_map.get_threat((2, 2), "player2") == 12
@@ -0,0 +1,69 @@
+import json
+import logging
+import pytest
+from utils.logger import GameLogger, RateLimitFilter, shutdown_listeners
+
+def read_lines(path):
+    shutdown_listeners()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_structured_logging_with_context(tmp_path):
+    path = tmp_path / "game.jsonl"
+    logger = GameLogger("test.structured", structured=True, log_file=str(path))
+    logger.bind(match_id="m1", turn=3, player="player1").info("moved %s to %s", "u1", (1, 2))
+    logger.debug("not written %s", "at info level")
+    entries = read_lines(path)
+    assert len(entries) == 1
+    assert entries[0]["msg"] == "moved u1 to (1, 2)"
+    assert entries[0]["match_id"] == "m1"
+    assert entries[0]["turn"] == 3
+
+def test_repeated_messages_are_rate_limited(tmp_path):
+    path = tmp_path / "game.jsonl"
+    logger = GameLogger("test.rate_limited", structured=True, log_file=str(path), rate_limit=(60.0, 2))
+    for i in range(5):
+        logger.warning("unit %s blocked", i)
+    entries = read_lines(path)
+    assert len(entries) == 3
+    assert entries[2]["suppressed"] == 3
+
+def test_rate_limit_reports_suppressed_count():
+    rate_limit = RateLimitFilter(period=60.0, burst=1)
+    make_record = lambda: logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    assert rate_limit.filter(make_record())
+    assert not rate_limit.filter(make_record())
+    rate_limit.period = 0.0
+    record = make_record()
+    assert rate_limit.filter(record)
+    assert record.suppressed == 1
+
+def test_conflicting_structured_config_is_rejected(tmp_path):
+    GameLogger("test.conflict")
+    with pytest.raises(ValueError):
+        GameLogger("test.conflict", structured=True, log_file=str(tmp_path / "game.jsonl"))
+    path = tmp_path / "game.jsonl"
+    logger = GameLogger("test.conflict", structured=True, log_file=str(path), reconfigure=True)
+    GameLogger("test.conflict", structured=True, log_file=str(path))
+    logger.info("written")
+    assert [entry["msg"] for entry in read_lines(path)] == ["written"]
+
+def test_suppressed_repeats_are_reported_on_shutdown(tmp_path):
+    path = tmp_path / "game.jsonl"
+    logger = GameLogger("test.flush", structured=True, log_file=str(path), rate_limit=(60.0, 1))
+    for i in range(4):
+        logger.warning("unit %s blocked", i)
+    entries = read_lines(path)
+    assert len(entries) == 2
+    assert entries[1]["suppressed"] == 3
+
+def test_rate_limits_are_kept_per_match(tmp_path):
+    path = tmp_path / "game.jsonl"
+    logger = GameLogger("test.per_match", structured=True, log_file=str(path), rate_limit=(60.0, 1))
+    first, second = logger.bind(match_id="m1"), logger.bind(match_id="m2")
+    for i in range(3):
+        first.warning("unit %s blocked", i)
+    second.warning("unit %s blocked", 0)
+    entries = read_lines(path)
+    assert [(entry["match_id"], entry.get("suppressed", 0)) for entry in entries] == [
+        ("m1", 0), ("m2", 0), ("m1", 2)
+    ]
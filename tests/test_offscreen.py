@@ -0,0 +1,56 @@
+import os
+from game.map import GameMap
+from game.unit import Unit, UnitType
+from ui.offscreen import OffscreenRenderer, RenderJob, render_batch
+
+def make_states():
+    states = []
+    for x in [0, 0, 1, 2]:
+        states.append([
+            Unit("u1", UnitType.INFANTRY, "player1", (x, 0)),
+            Unit("u2", UnitType.ARCHER, "player2", (7, 7))
+        ])
+    return states
+
+def test_unchanged_frames_are_not_written(tmp_path):
+    renderer = OffscreenRenderer(GameMap("small_duel"), cell_size=8)
+    paths = renderer.render_frames(make_states(), str(tmp_path))
+    assert len(paths) == 4
+    assert paths[0] == paths[1]
+    assert len(os.listdir(tmp_path)) == 3
+
+def test_contact_sheet(tmp_path):
+    renderer = OffscreenRenderer(GameMap("small_duel"), cell_size=8)
+    path = renderer.render_contact_sheet(make_states(), str(tmp_path / "thumb.png"), columns=2, thumb_width=32)
+    assert os.path.exists(path)
+
+def test_render_batch(tmp_path):
+    jobs = [RenderJob(GameMap("small_duel"), make_states(), str(tmp_path / f"match{i}"), cell_size=8) for i in range(2)]
+    results = render_batch(jobs, processes=1)
+    assert all(os.path.exists(result.thumbnail) for result in results)
+
+def test_render_job_sees_edited_terrain(tmp_path):
+    from game.unit import TerrainType
+    from ui import offscreen
+    game_map = GameMap("small_duel")
+    first = offscreen._get_renderer(game_map, 8)
+    edited = GameMap("small_duel")
+    edited.set_terrain((3, 0), TerrainType.WATER)
+    second = offscreen._get_renderer(edited, 8)
+    assert second is not first
+    assert second.game_map.get_terrain_at((3, 0)) == TerrainType.WATER
+    assert offscreen._get_renderer(GameMap("small_duel"), 8) is first
+
+def test_renderer_cache_is_bounded():
+    from ui import offscreen
+    for size in range(offscreen.MAX_CACHED_RENDERERS + 3):
+        offscreen._get_renderer(GameMap("small_duel"), 4 + size)
+    assert len(offscreen._renderers) <= offscreen.MAX_CACHED_RENDERERS
+
+def test_import_leaves_video_driver_alone():
+    import subprocess
+    import sys
+    env = {key: value for key, value in os.environ.items() if key != "SDL_VIDEODRIVER"}
+    code = "import os, ui.offscreen; print(os.environ.get('SDL_VIDEODRIVER'))"
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert output.stdout.splitlines()[-1] == "None"
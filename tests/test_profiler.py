@@ -0,0 +1,71 @@
+import json
+import os
+import time
+from utils.profiler import Instrumentation, instrumentation
+from game.game_state import GameState
+from game.map import GameMap
+from game.player import Player
+from game.unit import Unit, UnitType
+
+def test_disabled_instrumentation_records_nothing():
+    profiler = Instrumentation()
+    with profiler.timer("phase"):
+        pass
+    profiler.count("calls")
+    profiler.end_turn()
+    assert profiler.phases == {}
+    assert len(profiler.turns) == 0
+
+def test_turn_histograms_export(tmp_path):
+    profiler = Instrumentation()
+    profiler.enable()
+    for turn in range(3):
+        with profiler.timer("phase"):
+            pass
+        profiler.count("calls", 2)
+        profiler.end_turn(turn)
+    path = tmp_path / "profile.json"
+    profiler.export(str(path))
+    data = json.loads(path.read_text())
+    assert data["phases"]["phase"]["count"] == 3
+    assert data["turns"][2]["counters"] == {"calls": 2}
+
+def test_slow_turns_are_profiled(tmp_path):
+    profiler = Instrumentation()
+    profiler.enable(slow_turn_threshold=0.0, profile_dir=str(tmp_path))
+    profiler.end_turn("1:player1")
+    profiler.disable()
+    assert os.listdir(tmp_path) == ["turn_1_player1.prof"]
+
+def test_engine_phases_are_instrumented():
+    instrumentation.enable()
+    try:
+        GameMap("small_duel").get_valid_moves(Unit("u1", UnitType.INFANTRY, "player1", (0, 0)))
+        assert instrumentation.phases["move_generation"].count == 1
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+def test_slow_turns_are_sampled(tmp_path):
+    profiler = Instrumentation()
+    profiler.enable(slow_turn_threshold=0.0, profile_dir=str(tmp_path), sampling_interval=0.001)
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    profiler.end_turn("2:player2")
+    profiler.disable()
+    assert os.listdir(tmp_path) == ["turn_2_player2.stacks"]
+    assert "test_profiler.py:test_slow_turns_are_sampled" in (tmp_path / "turn_2_player2.stacks").read_text()
+
+def test_slow_turn_is_labelled_with_the_player_who_took_it(tmp_path):
+    state = GameState(4, 4)
+    for player_id in ("player1", "player2"):
+        state.add_player(Player(player_id, player_id))
+    instrumentation.enable(slow_turn_threshold=0.0, profile_dir=str(tmp_path))
+    try:
+        state.next_turn()
+        assert instrumentation.turns[-1]["turn"] == "0:player1"
+        assert os.listdir(tmp_path) == ["turn_0_player1.prof"]
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
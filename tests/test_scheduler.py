@@ -0,0 +1,90 @@
+from game.game_state import GameState
+from game.player import Player
+from game.scheduler import Order, SchedulingMode, TurnScheduler
+from game.unit import Unit, UnitStatus, UnitType
+
+def make_state(mode=SchedulingMode.ROTATION):
+    state = GameState(10, 10, map_name="mountain_pass", scheduler=TurnScheduler(mode))
+    for player_id in ("player1", "player2"):
+        state.add_player(Player(player_id, player_id))
+    state.players["player1"].add_unit(Unit("inf1", UnitType.INFANTRY, "player1", (2, 2)))
+    state.players["player1"].add_unit(Unit("cav1", UnitType.CAVALRY, "player1", (2, 3)))
+    state.players["player2"].add_unit(Unit("arc2", UnitType.ARCHER, "player2", (5, 2)))
+    state.players["player2"].add_unit(Unit("cav2", UnitType.CAVALRY, "player2", (5, 3)))
+    return state
+
+def test_rotation_alternates_players():
+    state = make_state()
+    seen = []
+    for _ in range(4):
+        state.next_turn()
+        seen.append((state.turn_number, state.current_player_id))
+    assert seen == [(0, "player2"), (1, "player1"), (1, "player2"), (2, "player1")]
+
+def test_initiative_orders_units_by_speed():
+    state = make_state(SchedulingMode.INITIATIVE)
+    order = []
+    for _ in range(5):
+        state.next_turn()
+        order.append((state.turn_number, state.scheduler.current_unit.unit_id))
+    assert order == [(0, "cav1"), (0, "cav2"), (0, "inf1"), (0, "arc2"), (1, "cav1")]
+
+def test_simultaneous_conflicting_moves_go_to_faster_unit():
+    state = make_state(SchedulingMode.SIMULTANEOUS)
+    state.scheduler.submit_orders("player1", [Order("inf1", "move", (3, 2))])
+    state.scheduler.submit_orders("player2", [Order("cav2", "move", (3, 2)), Order("arc2", "move", (2, 3))])
+    result = state.scheduler.resolve(state)
+    assert result.moved == ["cav2"]
+    assert sorted(result.blocked) == ["arc2", "inf1"]
+    assert state.get_unit_at_position((3, 2)).unit_id == "cav2"
+
+def test_simultaneous_attacks_use_positions_after_moves():
+    state = make_state(SchedulingMode.SIMULTANEOUS)
+    state.scheduler.submit_orders("player1", [Order("cav1", "move", (4, 3)), Order("cav1", "attack", (5, 3))])
+    state.scheduler.submit_orders("player2", [Order("arc2", "attack", (2, 2))])
+    state.next_turn()
+    assert state.turn_number == 1
+    assert state.players["player2"].units[1].health == 120 - (15 - 8)
+    assert state.players["player1"].units[0].health == 100 - (12 - 10)
+
+def test_scripts_run_concurrently_and_submit_orders():
+    state = make_state(SchedulingMode.SIMULTANEOUS)
+    def advance(state, player_id):
+        step = 1 if player_id == "player1" else -1
+        return [Order(unit.unit_id, "move", (unit.position[0] + step, unit.position[1]))
+                for unit in state.players[player_id].units]
+    state.scheduler.run_scripts(state, {"player1": advance, "player2": advance})
+    result = state.scheduler.resolve(state)
+    assert sorted(result.moved) == ["arc2", "cav1", "cav2", "inf1"]
+
+def test_simultaneous_units_attack_once_per_turn():
+    state = make_state(SchedulingMode.SIMULTANEOUS)
+    state.scheduler.submit_orders("player2", [Order("arc2", "attack", (2, 2))] * 3)
+    result = state.scheduler.resolve(state)
+    assert result.attacks == [("arc2", "inf1", 12 - 10)]
+    assert state.players["player1"].units[0].health == 100 - (12 - 10)
+    assert state.players["player2"].units[0].status == UnitStatus.ATTACKED
+
+def test_simultaneous_moves_beyond_movement_are_blocked():
+    state = make_state(SchedulingMode.SIMULTANEOUS)
+    state.scheduler.submit_orders("player1", [Order("inf1", "move", (2, 5)), Order("cav1", "move", (3, 4))])
+    result = state.scheduler.resolve(state)
+    assert result.blocked == ["inf1"]
+    assert result.moved == ["cav1"]
+    assert state.players["player1"].units[0].position == (2, 2)
+    assert state.players["player1"].units[1].status == UnitStatus.MOVED
+
+def test_rotation_follows_the_state_current_player():
+    state = GameState(10, 10, map_name="mountain_pass")
+    for player_id in ("p1", "p2", "p3"):
+        state.add_player(Player(player_id, player_id))
+    state.current_player_id = "p2"
+    state.next_turn()
+    assert (state.turn_number, state.current_player_id) == (0, "p3")
+    state.next_turn()
+    assert (state.turn_number, state.current_player_id) == (1, "p1")
+
+def test_rotation_without_players_does_nothing():
+    state = GameState(10, 10, map_name="mountain_pass")
+    state.next_turn()
+    assert (state.turn_number, state.current_player_id) == (0, None)
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous so the test only catches heavy imports creeping back in
+STARTUP_BUDGET = 0.5
+
+def run_fresh(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints"""
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def test_headless_startup_time():
+    result = run_fresh(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import game, ui\n"
+        "from utils.lazy import lazy_table\n"
+        "from game import GameState, UnitStatistics, TerrainEffects\n"
+        "state = GameState(8, 8)\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({\n"
+        "    'elapsed': elapsed,\n"
+        "    'pygame': 'pygame' in sys.modules,\n"
+        "    'tables_built': not isinstance(vars(UnitStatistics)['BASE_STATS'], lazy_table)\n"
+        "        or not isinstance(vars(TerrainEffects)['MOVEMENT_COSTS'], lazy_table),\n"
+        "}))\n"
+    )
+    assert not result["pygame"]
+    assert not result["tables_built"]
+    assert result["elapsed"] < STARTUP_BUDGET, (
+        f"headless startup took {result['elapsed'] * 1000:.1f} ms, budget is {STARTUP_BUDGET * 1000:.0f} ms"
+    )
+
+def test_ui_exports_load_pygame_on_use():
+    result = run_fresh(
+        "import json, sys\n"
+        "import ui\n"
+        "before = 'pygame' in sys.modules\n"
+        "ui.MapRenderer\n"
+        "print(json.dumps({'before': before, 'after': 'pygame' in sys.modules}))\n"
+    )
+    assert result == {"before": False, "after": True}
+
+def test_lazy_tables_are_built_once():
+    from game import UnitStatistics, UnitType
+    stats = UnitStatistics.BASE_STATS
+    assert stats is UnitStatistics.BASE_STATS
+    assert stats[UnitType.INFANTRY].health == 100
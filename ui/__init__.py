@@ -1,5 +1,24 @@
-# from .game_window import GameWindow
-# from .map_renderer import MapRenderer
-# from .colors import Colors
+import importlib
 
-# __all__ = ['GameWindow', 'MapRenderer', 'Colors'] 
\ No newline at end of file
+# Exported names and the submodule defining them. pygame is only imported once
+# one of these is first used.
+_EXPORTS = {
+    'GameWindow': '.game_window',
+    'MapRenderer': '.map_renderer',
+    'Colors': '.colors',
+    'OffscreenRenderer': '.offscreen',
+    'RenderJob': '.offscreen',
+    'render_batch': '.offscreen'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,8 @@
 import pygame
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Iterable
 from game.map import GameMap, TerrainType
+from game.unit import Unit, UnitStatus
+from utils.profiler import instrument
 from .colors import Colors
 
 class MapRenderer:
@@ -13,6 +15,10 @@ class MapRenderer:
         # Create surface for the map
         self.surface = pygame.Surface((self.width, self.height))
         
+        # Terrain and spawn points only change when the map is edited, so they
+        # are drawn once and reused for every frame
+        self.terrain_layer: Optional[pygame.Surface] = None
+        
     def get_cell_rect(self, x: int, y: int) -> pygame.Rect:
         """Get the rectangle for a cell position"""
         return pygame.Rect(
@@ -32,6 +38,10 @@ class MapRenderer:
             TerrainType.AIR: Colors.AIR
         }[terrain]
     
+    def get_player_color(self, player_id: str) -> Tuple[int, int, int]:
+        """Get color for a player"""
+        return Colors.PLAYER1 if player_id == "player1" else Colors.PLAYER2
+    
     def screen_to_grid(self, screen_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convert screen coordinates to grid coordinates"""
         x, y = screen_pos
@@ -42,10 +52,17 @@ class MapRenderer:
             return (grid_x, grid_y)
         return None
     
-    def render(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)) -> None:
-        """Render the map to the given surface"""
-        # Clear the surface
-        self.surface.fill(Colors.BACKGROUND)
+    def invalidate_terrain(self) -> None:
+        """Drop the cached terrain layer after the map has been edited"""
+        self.terrain_layer = None
+    
+    def get_terrain_layer(self) -> pygame.Surface:
+        """Get the cached terrain layer, drawing it on first use"""
+        if self.terrain_layer is not None:
+            return self.terrain_layer
+        
+        layer = pygame.Surface((self.width, self.height))
+        layer.fill(Colors.BACKGROUND)
         
         # Draw terrain
         for y in range(self.game_map.height):
@@ -55,22 +72,52 @@ class MapRenderer:
                 color = self.get_terrain_color(terrain)
                 
                 # Draw terrain cell
-                pygame.draw.rect(self.surface, color, cell_rect)
+                pygame.draw.rect(layer, color, cell_rect)
                 # Draw grid lines
-                pygame.draw.rect(self.surface, Colors.GRID, cell_rect, 1)
+                pygame.draw.rect(layer, Colors.GRID, cell_rect, 1)
         
         # Draw spawn points
         for player_id, spawn_points in self.game_map.spawn_points.items():
-            color = Colors.PLAYER1 if player_id == "player1" else Colors.PLAYER2
+            color = self.get_player_color(player_id)
             for x, y in spawn_points:
                 cell_rect = self.get_cell_rect(x, y)
                 # Draw spawn point indicator (circle)
                 pygame.draw.circle(
-                    self.surface,
+                    layer,
                     color,
                     (cell_rect.centerx, cell_rect.centery),
                     self.cell_size // 4
                 )
         
+        self.terrain_layer = layer
+        return layer
+    
+    def render_units(self, surface: pygame.Surface, units: Iterable[Unit]) -> None:
+        """Draw units as player-colored squares with a health bar"""
+        inset = max(1, self.cell_size // 6)
+        for unit in units:
+            if unit.status == UnitStatus.DEAD:
+                continue
+            x, y = unit.position
+            cell_rect = self.get_cell_rect(x, y)
+            body = cell_rect.inflate(-2 * inset, -2 * inset)
+            pygame.draw.rect(surface, self.get_player_color(unit.player_id), body)
+            pygame.draw.rect(surface, Colors.TEXT, body, 1)
+            
+            # Health bar along the bottom edge of the cell
+            if unit.max_health > 0:
+                bar_width = int(body.width * unit.health / unit.max_health)
+                bar_rect = pygame.Rect(body.left, cell_rect.bottom - inset + 1, bar_width, max(1, inset // 2))
+                pygame.draw.rect(surface, Colors.TEXT, bar_rect)
+    
+    @instrument('render')
+    def render(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+               units: Optional[Iterable[Unit]] = None) -> None:
+        """Render the map (and optionally units) to the given surface"""
+        self.surface.blit(self.get_terrain_layer(), (0, 0))
+        
+        if units is not None:
+            self.render_units(self.surface, units)
+        
         # Blit the map surface to the main surface
-        surface.blit(self.surface, offset) 
\ No newline at end of file
+        surface.blit(self.surface, offset)
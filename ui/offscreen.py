@@ -0,0 +1,159 @@
+import os
+import pygame
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from game.map import GameMap
+from game.unit import Unit
+from .map_renderer import MapRenderer
+from .colors import Colors
+
+def use_headless_display() -> None:
+    """Select SDL's dummy video driver for this process.
+
+    Offscreen rendering only draws onto plain surfaces and never needs a
+    display, so this is opt-in: call it in headless processes (servers, CI,
+    render workers) before anything initialises the pygame display. An
+    explicitly configured driver is left untouched.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+def get_state_units(state: Any) -> List[Unit]:
+    """Get the units of a state, which is either a GameState or an iterable of units"""
+    if hasattr(state, "players"):
+        return [unit for player in state.players.values() for unit in player.units]
+    return list(state)
+
+def get_frame_key(units: Iterable[Unit]) -> Tuple:
+    """Get a key that changes whenever the drawn image of the units would change"""
+    return tuple(sorted(
+        (unit.unit_id, unit.player_id, unit.position, unit.health, unit.max_health, unit.status.value)
+        for unit in units
+    ))
+
+class OffscreenRenderer:
+    """Renders a map and game states to images without opening a window"""
+
+    def __init__(self, game_map: GameMap, cell_size: int = 32):
+        self.game_map = game_map
+        self.map_renderer = MapRenderer(game_map, cell_size)
+        self.frame = pygame.Surface((self.map_renderer.width, self.map_renderer.height))
+
+    def render_frame(self, state: Any = ()) -> pygame.Surface:
+        """Render a single state and return the frame surface"""
+        self.frame.fill(Colors.BACKGROUND)
+        self.map_renderer.render(self.frame, (0, 0), get_state_units(state))
+        return self.frame
+
+    def save_frame(self, state: Any, path: str) -> str:
+        """Render a single state to a PNG file"""
+        pygame.image.save(self.render_frame(state), path)
+        return path
+
+    def render_frames(self, states: Iterable[Any], output_dir: str, prefix: str = "frame") -> List[str]:
+        """Render states to numbered PNG files.
+
+        A frame identical to the previous one is not written again; its entry in
+        the returned list points at the last file that was written instead.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        last_key = None
+        last_path = None
+        for index, state in enumerate(states):
+            units = get_state_units(state)
+            key = get_frame_key(units)
+            if key != last_key:
+                last_path = os.path.join(output_dir, f"{prefix}_{index:05d}.png")
+                self.save_frame(units, last_path)
+                last_key = key
+            paths.append(last_path)
+        return paths
+
+    def render_contact_sheet(self, states: Sequence[Any], path: str, columns: int = 4,
+                             max_frames: int = 16, thumb_width: int = 160) -> str:
+        """Render evenly sampled states into a single thumbnail grid"""
+        if not states:
+            picked = [()]
+        elif len(states) <= max_frames:
+            picked = list(states)
+        else:
+            step = (len(states) - 1) / (max_frames - 1)
+            picked = [states[round(i * step)] for i in range(max_frames)]
+
+        thumb_height = max(1, thumb_width * self.map_renderer.height // self.map_renderer.width)
+        columns = max(1, min(columns, len(picked)))
+        rows = (len(picked) + columns - 1) // columns
+        sheet = pygame.Surface((columns * thumb_width, rows * thumb_height))
+        sheet.fill(Colors.BACKGROUND)
+
+        for index, state in enumerate(picked):
+            thumb = pygame.transform.smoothscale(self.render_frame(state), (thumb_width, thumb_height))
+            sheet.blit(thumb, ((index % columns) * thumb_width, (index // columns) * thumb_height))
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        pygame.image.save(sheet, path)
+        return path
+
+@dataclass
+class RenderJob:
+    """A single match to render in a batch"""
+    game_map: GameMap
+    states: List[Any]
+    output_dir: str
+    frames: bool = True
+    thumbnail: bool = True
+    cell_size: int = 32
+
+@dataclass
+class RenderResult:
+    """Files written for a single match"""
+    output_dir: str
+    frames: List[str] = field(default_factory=list)
+    thumbnail: Optional[str] = None
+
+# Renderers are kept per worker process so matches played on the same map
+# share one terrain layer. Keyed on the map's content, since jobs arrive as
+# fresh copies and may carry edited terrain; least recently used are dropped.
+MAX_CACHED_RENDERERS = 8
+_renderers: "OrderedDict[Tuple, OffscreenRenderer]" = OrderedDict()
+
+def _get_renderer(game_map: GameMap, cell_size: int) -> OffscreenRenderer:
+    key = (
+        game_map.map_name,
+        cell_size,
+        tuple(tuple(row) for row in game_map.terrain),
+        tuple((player_id, tuple(points)) for player_id, points in sorted(game_map.spawn_points.items()))
+    )
+    renderer = _renderers.get(key)
+    if renderer is None:
+        renderer = OffscreenRenderer(game_map, cell_size)
+        _renderers[key] = renderer
+        while len(_renderers) > MAX_CACHED_RENDERERS:
+            _renderers.popitem(last=False)
+    else:
+        _renderers.move_to_end(key)
+    return renderer
+
+def render_job(job: RenderJob) -> RenderResult:
+    """Render the frames and thumbnail of a single match"""
+    renderer = _get_renderer(job.game_map, job.cell_size)
+    result = RenderResult(job.output_dir)
+    if job.frames:
+        result.frames = renderer.render_frames(job.states, job.output_dir)
+    if job.thumbnail:
+        result.thumbnail = renderer.render_contact_sheet(
+            job.states, os.path.join(job.output_dir, "thumbnail.png")
+        )
+    return result
+
+def render_batch(jobs: Sequence[RenderJob], processes: Optional[int] = None) -> List[RenderResult]:
+    """Render many matches across a process pool. Workers run headless; a
+    single process renders in place without touching the display settings."""
+    if processes == 1 or len(jobs) <= 1:
+        return [render_job(job) for job in jobs]
+    with Pool(processes, initializer=use_headless_display) as pool:
+        return pool.map(render_job, jobs)
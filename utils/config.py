@@ -1,28 +1,38 @@
+import copy
 from typing import Dict, Any
+from utils.lazy import lazy_table
 
 class GameConfig:
-    DEFAULT_CONFIG = {
-        "map_size": {
-            "width": 10,
-            "height": 10
-        },
-        "starting_resources": {
-            "gold": 1000,
-            "wood": 500,
-            "iron": 300,
-            "food": 800
-        },
-        "unit_costs": {
-            "infantry": {"gold": 100, "food": 50},
-            "cavalry": {"gold": 200, "food": 75},
-            "archer": {"gold": 150, "food": 50},
-            "siege": {"gold": 300, "wood": 100, "iron": 50}
-        },
-        "turn_timeout": 30  # seconds
-    }
+    @lazy_table
+    def DEFAULT_CONFIG(cls) -> Dict[str, Any]:
+        # Built on first use; unit costs are defined once, in UnitStatistics
+        from game.unit import UnitStatistics
+        return {
+            "map_size": {
+                "width": 10,
+                "height": 10
+            },
+            "starting_resources": {
+                "gold": 1000,
+                "wood": 500,
+                "iron": 300,
+                "food": 800
+            },
+            "unit_costs": {
+                unit_type.value: dict(stats.cost) for unit_type, stats in UnitStatistics.BASE_STATS.items()
+            },
+            "resource_income": {
+                "gold": 100,
+                "wood": 50,
+                "iron": 30,
+                "food": 80
+            },
+            "turn_timeout": 30  # seconds
+        }
     
     def __init__(self, custom_config: Dict[str, Any] = None):
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Each match gets its own copy so updates never touch the shared defaults
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         if custom_config:
             self._update_config(custom_config)
             
@@ -0,0 +1,21 @@
+from typing import Any, Callable
+
+class lazy_table:
+    """Class attribute built by the decorated function on first access.
+
+    The built value replaces the descriptor on the class, so later lookups are
+    plain attribute reads.
+    """
+
+    def __init__(self, builder: Callable[[type], Any]):
+        self.builder = builder
+        self.__doc__ = builder.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        value = self.builder(self.owner)
+        setattr(self.owner, self.name, value)
+        return value
@@ -1,27 +1,189 @@
+import atexit
+import json
 import logging
-from typing import Optional
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional, Tuple
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as compact single-line JSON objects"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 6),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        entry.update(getattr(record, 'context', None) or {})
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, separators=(',', ':'), default=str)
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most `burst` records with the same message template through per
+    `period` seconds. The first record of the next window carries the number of
+    records that were dropped.
+
+    Limits are kept per match: records bound to different match_id values
+    (see GameLogger.bind) are counted separately.
+    """
+
+    def __init__(self, period: float = 1.0, burst: int = 10):
+        super().__init__()
+        self.period = period
+        self.burst = burst
+        self._lock = threading.Lock()
+        # key -> [window_start, passed, suppressed]
+        self._windows: Dict[Tuple, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = getattr(record, 'context', None) or {}
+        key = (record.name, record.levelno, record.msg, context.get('match_id'))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+    def pop_suppressed(self) -> List[Tuple[Tuple, int]]:
+        """Get and reset the counts of records dropped in the current windows"""
+        with self._lock:
+            pending = [(key, window[2]) for key, window in self._windows.items() if window[2]]
+            for key, _ in pending:
+                self._windows[key][2] = 0
+        return pending
+
+# One queue and writer thread per output target, shared by all loggers in the process
+_listeners: Dict[str, Tuple[queue.SimpleQueue, QueueListener]] = {}
+_listeners_lock = threading.Lock()
+# Logger name -> (settings, handler) for loggers set up in structured mode
+_structured: Dict[str, Tuple[Tuple, logging.Handler]] = {}
+
+def _get_queue(log_file: Optional[str], max_bytes: int, backup_count: int) -> queue.SimpleQueue:
+    target = log_file or '<stderr>'
+    with _listeners_lock:
+        if target not in _listeners:
+            if log_file:
+                handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+            else:
+                handler = logging.StreamHandler()
+            handler.setFormatter(JsonLinesFormatter())
+            record_queue = queue.SimpleQueue()
+            listener = QueueListener(record_queue, handler, respect_handler_level=True)
+            listener.start()
+            _listeners[target] = (record_queue, listener)
+        return _listeners[target][0]
+
+def _flush_suppressed(handler: logging.Handler) -> None:
+    """Write one record per message whose last repeats were rate limited"""
+    for rate_limit in handler.filters:
+        if not isinstance(rate_limit, RateLimitFilter):
+            continue
+        for (name, level, msg, match_id), count in rate_limit.pop_suppressed():
+            record = logging.LogRecord(name, level, "", 0, msg, None, None)
+            record.suppressed = count
+            if match_id is not None:
+                record.context = {'match_id': match_id}
+            # emit() skips the filters, so the flush is not rate limited itself
+            handler.emit(record)
+
+def shutdown_listeners() -> None:
+    """Report rate-limited repeats, flush queued records and stop all writer threads"""
+    with _listeners_lock:
+        for name, (_, handler) in _structured.items():
+            _flush_suppressed(handler)
+            logging.getLogger(name).removeHandler(handler)
+        _structured.clear()
+        for _, listener in _listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _listeners.clear()
+
+atexit.register(shutdown_listeners)
 
 class GameLogger:
-    def __init__(self, name: str = "game_engine", level: int = logging.INFO):
+    def __init__(self, name: str = "game_engine", level: int = logging.INFO,
+                 structured: bool = False, log_file: Optional[str] = None,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 rate_limit: Optional[Tuple[float, int]] = None,
+                 context: Optional[Dict[str, Any]] = None, reconfigure: bool = False):
+        """Wrap a standard logger.
+
+        In structured mode records are handed to a background thread through a
+        queue and written as JSON lines, to a size-rotated log_file or stderr.
+        rate_limit is a (period_seconds, burst) pair limiting repeats of the
+        same message. context holds fields such as match_id, turn and player
+        added to every record.
+
+        Loggers are configured once per name. Asking for structured output
+        with different settings than an existing logger of that name raises
+        ValueError unless reconfigure is set, which replaces its handlers.
+        """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
-        
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        self.context: Dict[str, Any] = dict(context or {})
+
+        settings = (log_file, max_bytes, backup_count, tuple(rate_limit) if rate_limit else None)
+        if reconfigure:
+            for handler in list(self.logger.handlers):
+                self.logger.removeHandler(handler)
+            self.logger.propagate = True
+            _structured.pop(name, None)
+        elif structured and self.logger.handlers and _structured.get(name, (None,))[0] != settings:
+            raise ValueError(
+                f"Logger {name!r} is already configured differently; "
+                "pass reconfigure=True to replace its handlers"
             )
-            handler.setFormatter(formatter)
+
+        if not self.logger.handlers:
+            if structured:
+                handler = QueueHandler(_get_queue(log_file, max_bytes, backup_count))
+                if rate_limit:
+                    handler.addFilter(RateLimitFilter(*rate_limit))
+                self.logger.propagate = False
+                _structured[name] = (settings, handler)
+            else:
+                handler = logging.StreamHandler()
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                handler.setFormatter(formatter)
             self.logger.addHandler(handler)
-            
-    def info(self, message: str) -> None:
-        self.logger.info(message)
-        
-    def error(self, message: str) -> None:
-        self.logger.error(message)
-        
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
-        
-    def warning(self, message: str) -> None:
-        self.logger.warning(message) 
\ No newline at end of file
+
+    def bind(self, **fields: Any) -> "GameLogger":
+        """Get a logger sharing the same output with extra context fields"""
+        child = object.__new__(GameLogger)
+        child.logger = self.logger
+        child.context = {**self.context, **fields}
+        return child
+
+    # Arguments are only interpolated into the message if the level is enabled
+    def info(self, message: str, *args: Any) -> None:
+        self.logger.info(message, *args, extra={'context': self.context})
+
+    def error(self, message: str, *args: Any) -> None:
+        self.logger.error(message, *args, extra={'context': self.context})
+
+    def debug(self, message: str, *args: Any) -> None:
+        self.logger.debug(message, *args, extra={'context': self.context})
+
+    def warning(self, message: str, *args: Any) -> None:
+        self.logger.warning(message, *args, extra={'context': self.context})
@@ -0,0 +1,250 @@
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+class _NullTimer:
+    """Timer returned while instrumentation is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NULL_TIMER = _NullTimer()
+
+class _Timer:
+    def __init__(self, instrumentation: "Instrumentation", name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.instrumentation.record(self.name, time.perf_counter() - self.start)
+
+class PhaseStats:
+    """Aggregated timings of one named phase"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # Bucket k holds durations below 2**k microseconds
+        self.histogram: Dict[int, int] = {}
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'histogram_us': {f"<{2 ** bucket}": n for bucket, n in sorted(self.histogram.items())}
+        }
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread.
+
+    Much cheaper than cProfile for the sampled thread, at the cost of only
+    seeing where time went at the sampling interval.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def clear(self) -> None:
+        self.samples = Counter()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def dump(self, path: str) -> None:
+        """Write samples in collapsed-stack format, one 'stack count' per line"""
+        with open(path, 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+class Instrumentation:
+    """Named timers and counters for engine phases, aggregated per turn.
+
+    Disabled by default; while disabled, timers and counters return after a
+    single attribute check.
+    """
+
+    def __init__(self, max_turns: int = 10000):
+        self.enabled = False
+        self.phases: Dict[str, PhaseStats] = {}
+        self.turns: Deque[Dict] = deque(maxlen=max_turns)
+        self.slow_turn_threshold: Optional[float] = None
+        self.profile_dir: Optional[str] = None
+        self._turn_phases: Dict[str, float] = {}
+        self._turn_counters: Dict[str, int] = {}
+        self._turn_start = 0.0
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+
+    def enable(self, slow_turn_threshold: Optional[float] = None, profile_dir: Optional[str] = None,
+               sampling_interval: Optional[float] = None) -> None:
+        """Start collecting. Turns slower than slow_turn_threshold seconds are
+        captured and written to profile_dir.
+
+        Whether a turn is slow is only known once it ends, so the capture runs
+        on every turn and is kept only for slow ones. By default this is
+        cProfile, which slows down every turn noticeably. Pass
+        sampling_interval (seconds) to sample the calling thread's stack from
+        a background thread instead; slow turns are then written as
+        collapsed stacks (.stacks) rather than .prof files.
+        """
+        self.disable()
+        self.enabled = True
+        self.slow_turn_threshold = slow_turn_threshold
+        self.profile_dir = profile_dir
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+        if sampling_interval is not None and slow_turn_threshold is not None and profile_dir:
+            self._sampler = StackSampler(sampling_interval)
+            self._sampler.start()
+        self._start_turn()
+
+    def disable(self) -> None:
+        """Stop collecting, keeping what was collected so far"""
+        self.enabled = False
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    def reset(self) -> None:
+        """Drop all collected timings"""
+        self.phases.clear()
+        self.turns.clear()
+        self._turn_phases = {}
+        self._turn_counters = {}
+        self._turn_start = time.perf_counter()
+
+    def timer(self, name: str):
+        """Context manager timing a block under the given phase name"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration for a phase"""
+        if not self.enabled:
+            return
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        stats.add(seconds)
+        self._turn_phases[name] = self._turn_phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter for the current turn"""
+        if not self.enabled:
+            return
+        self._turn_counters[name] = self._turn_counters.get(name, 0) + amount
+
+    def end_turn(self, label: Any = None) -> None:
+        """Close the current turn and start aggregating the next one"""
+        if not self.enabled:
+            return
+        duration = time.perf_counter() - self._turn_start
+        if self._profiler is not None:
+            self._profiler.disable()
+        if (self._profiler is not None or self._sampler is not None) and duration >= self.slow_turn_threshold:
+            self._dump_profile(label)
+        self.record('turn', duration)
+        self.turns.append({
+            'turn': label if label is not None else len(self.turns),
+            'duration': duration,
+            'phases': self._turn_phases,
+            'counters': self._turn_counters
+        })
+        self._start_turn()
+
+    def _start_turn(self) -> None:
+        self._turn_phases = {}
+        self._turn_counters = {}
+        self._profiler = None
+        if self._sampler is not None:
+            self._sampler.clear()
+        elif self.slow_turn_threshold is not None and self.profile_dir:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._turn_start = time.perf_counter()
+
+    def _dump_profile(self, label: Any) -> None:
+        name = str(label if label is not None else len(self.turns)).replace(os.sep, '_').replace(':', '_')
+        if self._sampler is not None:
+            self._sampler.dump(os.path.join(self.profile_dir, f"turn_{name}.stacks"))
+        else:
+            self._profiler.dump_stats(os.path.join(self.profile_dir, f"turn_{name}.prof"))
+
+    def summary(self) -> Dict:
+        """Get per-phase statistics including duration histograms"""
+        return {name: stats.to_dict() for name, stats in sorted(self.phases.items())}
+
+    def export(self, path: str) -> None:
+        """Write per-phase histograms and per-turn breakdowns as JSON"""
+        with open(path, 'w') as f:
+            json.dump({'phases': self.summary(), 'turns': list(self.turns)}, f, indent=2, default=str)
+
+# Shared by the whole engine
+instrumentation = Instrumentation()
+
+def instrument(name: str) -> Callable:
+    """Decorator timing every call of a function under the given phase name"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                instrumentation.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator